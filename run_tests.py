@@ -153,9 +153,10 @@ class VideoProcessorTestRunner:
             else:
                 cmd.extend(["-m", markers])
 
-        # Parallel execution
+        # Parallel execution; tests of one file share a worker so module-scoped
+        # fixtures are only set up once
         if parallel and workers > 1:
-            cmd.extend(["-n", str(workers)])
+            cmd.extend(["-n", str(workers), "--dist=loadfile"])
 
         # Coverage
         if coverage:
@@ -12,7 +12,10 @@ import pytest
 from video_processor import ProcessorConfig, VideoProcessor
 
 # Import our testing framework components
-from tests.framework.fixtures import VideoTestFixtures
+from tests.framework.fixtures import (
+    VideoTestFixtures,
+    cleanup_async_test_environment,
+)
 from tests.framework.config import TestingConfig
 from tests.framework.quality import QualityMetricsCalculator
 
@@ -132,9 +135,11 @@ def event_loop():
 
 # Enhanced fixtures from our testing framework
 @pytest.fixture
-def enhanced_temp_dir() -> Generator[Path, None, None]:
+def enhanced_temp_dir(tmp_path_factory) -> Generator[Path, None, None]:
     """Enhanced temporary directory with proper cleanup and structure."""
-    return VideoTestFixtures.enhanced_temp_dir()
+    temp_path = VideoTestFixtures.enhanced_temp_dir(tmp_path_factory)
+    yield temp_path
+    shutil.rmtree(temp_path, ignore_errors=True)
 
 
 @pytest.fixture
@@ -149,37 +154,43 @@ def enhanced_processor(video_config: ProcessorConfig) -> VideoProcessor:
     return VideoTestFixtures.enhanced_processor(video_config)
 
 
+@pytest.fixture(scope="session")
+def ffmpeg_mocks():
+    """Preconfigured FFmpeg result mocks, without patching anything."""
+    return VideoTestFixtures.ffmpeg_mocks()
+
+
 @pytest.fixture
-def mock_ffmpeg_environment(monkeypatch):
+def mock_ffmpeg_environment(ffmpeg_mocks, monkeypatch):
     """Comprehensive FFmpeg mocking environment."""
-    return VideoTestFixtures.mock_ffmpeg_environment(monkeypatch)
+    return VideoTestFixtures.mock_ffmpeg_environment(ffmpeg_mocks, monkeypatch)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_video_scenarios():
     """Predefined test video scenarios for comprehensive testing."""
     return VideoTestFixtures.test_video_scenarios()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def performance_benchmarks():
     """Performance benchmarks for different video processing operations."""
     return VideoTestFixtures.performance_benchmarks()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def video_360_fixtures():
     """Specialized fixtures for 360° video testing."""
     return VideoTestFixtures.video_360_fixtures()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def ai_analysis_fixtures():
     """Fixtures for AI-powered video analysis testing."""
     return VideoTestFixtures.ai_analysis_fixtures()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def streaming_fixtures():
     """Fixtures for streaming and adaptive bitrate testing."""
     return VideoTestFixtures.streaming_fixtures()
@@ -188,7 +199,11 @@ def streaming_fixtures():
 @pytest.fixture
 async def async_test_environment():
     """Async environment setup for testing async video processing."""
-    return VideoTestFixtures.async_test_environment()
+    environment = VideoTestFixtures.async_test_environment()
+    try:
+        yield environment
+    finally:
+        await cleanup_async_test_environment(environment)
 
 
 @pytest.fixture
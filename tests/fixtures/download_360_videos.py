@@ -10,15 +10,28 @@ spherical metadata injection.
 import asyncio
 import json
 import logging
+import os
+import shutil
 import subprocess
 import time
 from pathlib import Path
+from urllib.parse import urlparse
 
 from tqdm import tqdm
 
 logger = logging.getLogger(__name__)
 
 
+def _trim_window(trim: tuple[float, float]) -> tuple[float, float]:
+    """Convert a ``(start, end)`` trim into ``(start, duration)``."""
+    start, end = trim
+    duration = end - start
+    if duration <= 0:
+        raise ValueError(f"Invalid trim {trim}: end must be after start")
+
+    return start, duration
+
+
 class Video360Downloader:
     """Download and prepare 360° test videos from curated sources."""
 
@@ -109,6 +122,16 @@ class Video360Downloader:
         },
     }
 
+    # Trim windows as (start, duration), validated once at import time
+    TRIM_WINDOWS = {
+        category: _trim_window(info["trim"])
+        for category, info in VIDEO_360_SOURCES.items()
+        if info["trim"]
+    }
+
+    # Number of concurrent downloads (matches the per-host connection limit)
+    DOWNLOAD_CONCURRENCY = 4
+
     # Different 360° formats to ensure comprehensive testing
     VIDEO_360_FORMATS = {
         "projections": [
@@ -157,22 +180,18 @@ class Video360Downloader:
         self.download_log = []
         self.failed_downloads = []
 
+        # Shared HTTP session, set for the duration of download_all()
+        self._session = None
+
     def check_dependencies(self) -> bool:
         """Check if required dependencies are available."""
-        dependencies = {
-            "yt-dlp": "yt-dlp --version",
-            "ffmpeg": "ffmpeg -version",
-            "ffprobe": "ffprobe -version",
-        }
-
-        missing = []
-        for name, cmd in dependencies.items():
-            try:
-                result = subprocess.run(cmd.split(), capture_output=True)
-                if result.returncode != 0:
-                    missing.append(name)
-            except FileNotFoundError:
-                missing.append(name)
+        # A PATH lookup is enough to know the tools are installed; spawning
+        # each binary just to read its version is needlessly slow
+        missing = [
+            name
+            for name in ("yt-dlp", "ffmpeg", "ffprobe")
+            if shutil.which(name) is None
+        ]
 
         if missing:
             logger.error(f"Missing dependencies: {missing}")
@@ -239,8 +258,17 @@ class Video360Downloader:
 
             timeout_config = aiohttp.ClientTimeout(total=timeout)
 
-            async with aiohttp.ClientSession(timeout=timeout_config) as session:
-                async with session.get(url) as response:
+            # Reuse the shared session from download_all() when available so
+            # consecutive requests to the same host hit a warm connection
+            if self._session is not None:
+                session = self._session
+                owns_session = False
+            else:
+                session = aiohttp.ClientSession()
+                owns_session = True
+
+            try:
+                async with session.get(url, timeout=timeout_config) as response:
                     if response.status != 200:
                         logger.error(f"HTTP {response.status}: {url}")
                         return False
@@ -260,6 +288,9 @@ class Video360Downloader:
                                 await f.write(chunk)
                                 downloaded += len(chunk)
                                 pbar.update(len(chunk))
+            finally:
+                if owns_session:
+                    await session.close()
 
             logger.info(f"Downloaded: {output_path.name}")
             return True
@@ -308,9 +339,8 @@ class Video360Downloader:
             result = subprocess.run(cmd, capture_output=True, text=True)
 
             if result.returncode == 0:
-                # Replace original with metadata version
-                video_path.unlink()
-                temp_path.rename(video_path)
+                # Atomically replace original with metadata version
+                os.replace(temp_path, video_path)
                 logger.info(f"Injected spherical metadata: {video_path.name}")
                 return True
             else:
@@ -326,31 +356,24 @@ class Video360Downloader:
     def has_spherical_metadata(self, video_path: Path) -> bool:
         """Check if video has spherical metadata."""
         try:
+            # Only ask ffprobe for the spherical tags of the first video stream;
+            # any output at all means one of them is present.
             cmd = [
                 "ffprobe",
                 "-v",
                 "quiet",
-                "-print_format",
-                "json",
-                "-show_streams",
+                "-select_streams",
+                "v:0",
+                "-show_entries",
+                "stream_tags=spherical,Spherical,projection,Projection",
+                "-of",
+                "default=nw=1:nk=0",
                 str(video_path),
             ]
 
             result = subprocess.run(cmd, capture_output=True, text=True)
-            if result.returncode == 0:
-                data = json.loads(result.stdout)
-                for stream in data.get("streams", []):
-                    if stream.get("codec_type") == "video":
-                        # Check for spherical tags
-                        tags = stream.get("tags", {})
-                        spherical_tags = [
-                            "spherical",
-                            "Spherical",
-                            "projection",
-                            "Projection",
-                        ]
-                        if any(tag in tags for tag in spherical_tags):
-                            return True
+            if result.returncode == 0 and result.stdout.strip():
+                return True
 
         except Exception as e:
             logger.warning(f"Failed to check metadata: {e}")
@@ -380,8 +403,7 @@ class Video360Downloader:
         try:
             result = subprocess.run(cmd, capture_output=True, text=True)
             if result.returncode == 0:
-                video_path.unlink()
-                temp_path.rename(video_path)
+                os.replace(temp_path, video_path)
                 logger.info(f"Trimmed to {duration}s: {video_path.name}")
                 return True
             else:
@@ -416,82 +438,89 @@ class Video360Downloader:
         else:
             return self.dirs["equirectangular"]
 
-    async def download_category(self, category: str, info: dict) -> list[Path]:
-        """Download all videos from a specific category."""
-        downloaded_files = []
+    async def fetch_source(
+        self, category: str, name: str, url: str, info: dict
+    ) -> Path | None:
+        """Download a single video without post-processing it."""
+        try:
+            # Determine output directory and filename
+            out_dir = self.categorize_video(name, info)
+            filename = f"{category}_{name}.mp4"
+            output_path = out_dir / filename
+
+            # Download based on source type
+            success = False
+            if "youtube.com" in url or "youtu.be" in url:
+                success = await self.download_youtube_360(url, output_path)
+            else:
+                success = await self.download_file(url, output_path)
+
+            if success and output_path.exists():
+                return output_path
+
+            self.failed_downloads.append(
+                {
+                    "category": category,
+                    "name": name,
+                    "url": url,
+                    "error": "Download failed",
+                }
+            )
+            print(f"  ✗ {filename} (download failed)")
 
-        print(f"\n📦 Downloading {category} ({info['description']}):")
-        print(f"   License: {info['license']}")
+        except Exception as e:
+            logger.error(f"Error downloading {name}: {e}")
+            self.failed_downloads.append(
+                {"category": category, "name": name, "url": url, "error": str(e)}
+            )
+            print(f"  ✗ {name} (error: {e})")
 
-        for name, url in info["urls"].items():
-            try:
-                # Determine output directory and filename
-                out_dir = self.categorize_video(name, info)
-                filename = f"{category}_{name}.mp4"
-                output_path = out_dir / filename
-
-                # Download based on source type
-                success = False
-                if "youtube.com" in url or "youtu.be" in url:
-                    success = await self.download_youtube_360(url, output_path)
-                else:
-                    success = await self.download_file(url, output_path)
-
-                if success and output_path.exists():
-                    # Inject spherical metadata
-                    self.inject_spherical_metadata(output_path)
-
-                    # Trim if specified
-                    if info.get("trim") and output_path.exists():
-                        start, end = info["trim"]
-                        duration = end - start
-                        if duration > 0:
-                            self.trim_video(output_path, start, duration)
-
-                    if output_path.exists():
-                        downloaded_files.append(output_path)
-                        self.download_log.append(
-                            {
-                                "category": category,
-                                "name": name,
-                                "url": url,
-                                "file": str(output_path),
-                                "status": "success",
-                            }
-                        )
-                        print(f"  ✓ {filename}")
-                    else:
-                        self.failed_downloads.append(
-                            {
-                                "category": category,
-                                "name": name,
-                                "url": url,
-                                "error": "File disappeared after processing",
-                            }
-                        )
-                        print(f"  ✗ {filename} (processing failed)")
-                else:
-                    self.failed_downloads.append(
-                        {
-                            "category": category,
-                            "name": name,
-                            "url": url,
-                            "error": "Download failed",
-                        }
-                    )
-                    print(f"  ✗ {filename} (download failed)")
+        return None
 
-                # Rate limiting to be respectful
-                await asyncio.sleep(2)
+    def finalize_source(
+        self, category: str, name: str, url: str, info: dict, output_path: Path
+    ) -> Path | None:
+        """Inject metadata into and trim a downloaded video."""
+        try:
+            # Inject spherical metadata
+            self.inject_spherical_metadata(output_path)
 
-            except Exception as e:
-                logger.error(f"Error downloading {name}: {e}")
-                self.failed_downloads.append(
-                    {"category": category, "name": name, "url": url, "error": str(e)}
+            # Trim if specified
+            trim = self.TRIM_WINDOWS.get(category)
+            if trim and output_path.exists():
+                self.trim_video(output_path, *trim)
+
+            if output_path.exists():
+                self.download_log.append(
+                    {
+                        "category": category,
+                        "name": name,
+                        "url": url,
+                        "file": str(output_path),
+                        "status": "success",
+                    }
                 )
-                print(f"  ✗ {name} (error: {e})")
+                print(f"  ✓ {output_path.name}")
+                return output_path
+
+            self.failed_downloads.append(
+                {
+                    "category": category,
+                    "name": name,
+                    "url": url,
+                    "error": "File disappeared after processing",
+                }
+            )
+            print(f"  ✗ {output_path.name} (processing failed)")
 
-        return downloaded_files
+        except Exception as e:
+            logger.error(f"Error processing {name}: {e}")
+            self.failed_downloads.append(
+                {"category": category, "name": name, "url": url, "error": str(e)}
+            )
+            print(f"  ✗ {name} (error: {e})")
+
+        return None
 
     async def download_all(self, priority_filter: str | None = None) -> dict:
         """Download all 360° test videos."""
@@ -511,10 +540,64 @@ class Video360Downloader:
                 if v.get("priority", "medium") == priority_filter
             }
 
-        # Download each category
+        # Downloads from different categories interleave below, so describe
+        # every category up front
         for category, info in sources_to_download.items():
-            downloaded = await self.download_category(category, info)
-            all_downloaded.extend(downloaded)
+            print(f"\n📦 Downloading {category} ({info['description']}):")
+            print(f"   License: {info['license']}")
+
+        # Flatten every source and order by host so consecutive downloads
+        # share a warm keep-alive connection instead of churning the pool
+        all_urls = [
+            (category, name, url, info)
+            for category, info in sources_to_download.items()
+            for name, url in info["urls"].items()
+        ]
+        all_urls.sort(key=lambda source: urlparse(source[2]).netloc)
+        pending = iter(all_urls)
+
+        # Downloads (network bound) feed post-processing (ffmpeg bound)
+        # through a bounded queue so slow ffmpeg runs never hold a
+        # download slot
+        ready: asyncio.Queue[tuple[Path, tuple] | None] = asyncio.Queue(maxsize=16)
+        postprocess_workers = max(1, (os.cpu_count() or 2) // 2)
+
+        async def downloader() -> None:
+            for source in pending:
+                output_path = await self.fetch_source(*source)
+                if output_path:
+                    await ready.put((output_path, source))
+
+                # Rate limiting to be respectful
+                await asyncio.sleep(2)
+
+        async def post_processor() -> None:
+            while (item := await ready.get()) is not None:
+                output_path, source = item
+                finalized = await asyncio.to_thread(
+                    self.finalize_source, *source, output_path
+                )
+                if finalized:
+                    all_downloaded.append(finalized)
+
+        import aiohttp
+
+        connector = aiohttp.TCPConnector(limit_per_host=4)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            self._session = session
+            try:
+                consumers = [
+                    asyncio.create_task(post_processor())
+                    for _ in range(postprocess_workers)
+                ]
+                await asyncio.gather(
+                    *(downloader() for _ in range(self.DOWNLOAD_CONCURRENCY))
+                )
+                for _ in consumers:
+                    await ready.put(None)
+                await asyncio.gather(*consumers)
+            finally:
+                self._session = None
 
         # Create download summary
         self.save_download_summary()
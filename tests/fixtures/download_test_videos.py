@@ -3,14 +3,154 @@ Download open source and Creative Commons videos for testing.
 Sources include Blender Foundation, Wikimedia Commons, and more.
 """
 
+import ctypes
+import functools
 import hashlib
 import json
+import os
+import queue
+import re
 import subprocess
+import sys
+import threading
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, BinaryIO
 from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def _sha256_file(path: Path) -> str:
+    """Hash a file in fixed-size blocks without loading it into memory."""
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+# fallocate(2) flag that reserves blocks without changing the file size
+_FALLOC_FL_KEEP_SIZE = 0x01
+
+
+@functools.cache
+def _fallocate() -> Any:
+    """Return libc's Linux-only ``fallocate``, or None where it is missing."""
+    try:
+        fallocate = ctypes.CDLL(None, use_errno=True).fallocate
+    except (OSError, AttributeError):
+        return None
+    fallocate.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_int64, ctypes.c_int64]
+    fallocate.restype = ctypes.c_int
+    return fallocate
+
+
+def _preallocate(f: BinaryIO, offset: int, length: int) -> None:
+    """
+    Reserve contiguous disk space for a download of known size.
+
+    The file size is left alone, unlike ``os.posix_fallocate``, so after a
+    hard kill a partial file still ends at the last byte received and the
+    download resumes from there.
+    """
+    fallocate = _fallocate()
+    if length <= 0 or fallocate is None:
+        return
+    # Failure is harmless: not every filesystem supports it (e.g. some
+    # network mounts), and the download simply proceeds unreserved
+    fallocate(f.fileno(), _FALLOC_FL_KEEP_SIZE, offset, length)
+
+
+def _write_chunks(
+    chunks: Iterable[bytes], f: BinaryIO, hasher: Any, pbar: tqdm
+) -> None:
+    """
+    Write downloaded chunks from a separate thread.
+
+    The calling thread only reads from the network and hands chunks over a
+    bounded queue, so socket reads overlap disk writes and hashing.
+    """
+    pending: queue.Queue[bytes | None] = queue.Queue(maxsize=8)
+    errors: list[BaseException] = []
+
+    def writer() -> None:
+        try:
+            while (chunk := pending.get()) is not None:
+                f.write(chunk)
+                if hasher:
+                    hasher.update(chunk)
+                pbar.update(len(chunk))
+        except BaseException as e:
+            errors.append(e)
+            # Keep draining so the reader never blocks on a full queue
+            while pending.get() is not None:
+                pass
+
+    thread = threading.Thread(target=writer, daemon=True)
+    thread.start()
+    try:
+        for chunk in chunks:
+            if errors:
+                break
+            pending.put(chunk)
+    finally:
+        # Everything already received is written before returning
+        pending.put(None)
+        thread.join()
+
+    if errors:
+        raise errors[0]
+
+
+def _content_range_total(content_range: str | None) -> int | None:
+    """Return the complete length from a ``Content-Range`` header, if known."""
+    if not content_range:
+        return None
+    total = content_range.rpartition("/")[2].strip()
+    return int(total) if total.isdigit() else None
+
+
+def _parse_frame_rate(rate: str) -> float:
+    """Parse an ffprobe ``num/den`` frame rate, treating ``0/0`` as 0."""
+    num, _, den = rate.partition("/")
+    den = int(den or 1)
+    return int(num) / den if den else 0.0
+
+
+# Extensions picked up when building the manifest
+VIDEO_EXTENSIONS = frozenset({".mp4", ".webm", ".mkv", ".mov", ".ogv"})
+
+# Source names that identify a specific resolution
+_RESOLUTION_NAME = re.compile(r"1080p|720p|4k")
+
+
+@dataclass(frozen=True)
+class DownloadJob:
+    """A single planned download."""
+
+    url: str
+    dir_key: str
+    filename: str
+    trim: tuple[float, float] | None = None
+
+
+@dataclass(frozen=True)
+class RemoteMeta:
+    """What a HEAD request reports about a remote file."""
+
+    size: int = 0
+    validator: str | None = None  # ETag, or Last-Modified without one
+    accepts_ranges: bool = False
 
 
 class TestVideoDownloader:
@@ -39,17 +179,29 @@ class TestVideoDownloader:
         },
     }
 
-    def __init__(self, output_dir: Path, max_size_mb: int = 50):
+    def __init__(self, output_dir: Path, max_size_mb: int = 50, max_workers: int = 8):
         """
         Initialize downloader.
 
         Args:
             output_dir: Directory to save downloaded videos
             max_size_mb: Maximum size per video in MB
+            max_workers: Number of concurrent downloads
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.max_size_bytes = max_size_mb * 1024 * 1024
+        self.max_workers = max_workers
+
+        # One pooled session so repeat requests to a host reuse connections
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.5),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
 
         # Create category directories
         self.dirs = {
@@ -63,7 +215,12 @@ class TestVideoDownloader:
             dir_path.mkdir(parents=True, exist_ok=True)
 
     def download_file(
-        self, url: str, output_path: Path, expected_hash: str | None = None
+        self,
+        url: str,
+        output_path: Path,
+        expected_hash: str | None = None,
+        position: int | None = None,
+        meta: RemoteMeta | None = None,
     ) -> bool:
         """
         Download a file with progress bar.
@@ -72,59 +229,177 @@ class TestVideoDownloader:
             url: URL to download
             output_path: Path to save file
             expected_hash: Optional SHA256 hash for verification
+            position: Progress bar line, so concurrent bars stack cleanly
+            meta: HEAD metadata for the URL, if the caller already fetched it
 
         Returns:
             Success status
         """
-        if output_path.exists():
-            if expected_hash:
-                with open(output_path, "rb") as f:
-                    file_hash = hashlib.sha256(f.read()).hexdigest()
-                    if file_hash == expected_hash:
-                        print(f"✓ Already exists: {output_path.name}")
-                        return True
-            else:
-                print(f"✓ Already exists: {output_path.name}")
-                return True
+        # A HEAD request is enough to skip unchanged or oversized files
+        if meta is None:
+            meta = self._remote_meta(url)
+
+        if self._is_fresh(output_path, meta, expected_hash):
+            print(f"✓ Already exists: {output_path.name}")
+            return True
+
+        if meta.size > self.max_size_bytes:
+            print(f"⚠ Skipping {url}: Too large ({meta.size / 1024 / 1024:.1f}MB)")
+            return False
+
+        # Download into a .part file so an interrupted run can resume it
+        part_path = output_path.with_suffix(output_path.suffix + ".part")
+        resume_from = part_path.stat().st_size if part_path.exists() else 0
 
         try:
-            response = requests.get(url, stream=True, timeout=30)
+            # Ask for an unencoded body so it can be read straight off the
+            # socket and byte ranges line up with the file on disk
+            headers = {"Accept-Encoding": "identity"}
+            if resume_from:
+                headers["Range"] = f"bytes={resume_from}-"
+
+            response = self.session.get(url, stream=True, timeout=30, headers=headers)
+            if response.status_code == 416:
+                response.close()
+                total = _content_range_total(response.headers.get("content-range"))
+                if total == resume_from:
+                    # The partial file is already complete, e.g. the last run
+                    # was killed between the final write and the rename
+                    if expected_hash and _sha256_file(part_path) != expected_hash:
+                        part_path.unlink()
+                        print(f"✗ Hash mismatch for {output_path.name}")
+                        return False
+                    return self._finish_download(part_path, output_path, meta)
+
+                # Partial file no longer matches the remote; start over now
+                part_path.unlink()
+                resume_from = 0
+                del headers["Range"]
+                response = self.session.get(
+                    url, stream=True, timeout=30, headers=headers
+                )
             response.raise_for_status()
 
-            total_size = int(response.headers.get("content-length", 0))
+            # Servers that ignore Range send the whole body again
+            if response.status_code != 206:
+                resume_from = 0
+
+            total_size = resume_from + int(response.headers.get("content-length", 0))
 
             # Check size limit
             if total_size > self.max_size_bytes:
+                response.close()
                 print(f"⚠ Skipping {url}: Too large ({total_size / 1024 / 1024:.1f}MB)")
                 return False
 
-            # Download with progress bar
-            with open(output_path, "wb") as f:
+            # Read large raw blocks unless the server compressed the body
+            # anyway, in which case requests has to decode it
+            if response.headers.get("content-encoding", "identity") == "identity":
+                chunks = response.raw.stream(1 << 20, decode_content=False)
+            else:
+                chunks = response.iter_content(chunk_size=8192)
+
+            # Hash while streaming so verification needs no second disk pass;
+            # a resumed download only has to re-read the bytes already on disk
+            hasher = None
+            if expected_hash:
+                if resume_from:
+                    with open(part_path, "rb") as f:
+                        hasher = hashlib.file_digest(f, "sha256")
+                else:
+                    hasher = hashlib.sha256()
+
+            # Download with progress bar; the 1 MiB write buffer coalesces
+            # small decoded chunks into large write() syscalls
+            mode = "r+b" if resume_from else "wb"
+            with response, open(part_path, mode, buffering=1 << 20) as f:
+                f.seek(resume_from)
+                _preallocate(f, resume_from, total_size - resume_from)
+                # Refresh the bar at most every 256 KiB / 200 ms, and not at
+                # all when nobody is watching (e.g. CI logs)
                 with tqdm(
-                    total=total_size, unit="B", unit_scale=True, desc=output_path.name
+                    total=total_size,
+                    initial=resume_from,
+                    unit="B",
+                    unit_scale=True,
+                    desc=output_path.name,
+                    position=position,
+                    mininterval=0.2,
+                    miniters=1 << 18,
+                    disable=not sys.stderr.isatty(),
                 ) as pbar:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        f.write(chunk)
-                        pbar.update(len(chunk))
+                    _write_chunks(chunks, f, hasher, pbar)
 
             # Verify hash if provided
-            if expected_hash:
-                with open(output_path, "rb") as f:
-                    file_hash = hashlib.sha256(f.read()).hexdigest()
-                    if file_hash != expected_hash:
-                        output_path.unlink()
-                        print(f"✗ Hash mismatch for {output_path.name}")
-                        return False
+            if hasher:
+                if hasher.hexdigest() != expected_hash:
+                    part_path.unlink()
+                    print(f"✗ Hash mismatch for {output_path.name}")
+                    return False
 
-            print(f"✓ Downloaded: {output_path.name}")
-            return True
+            return self._finish_download(part_path, output_path, meta)
 
         except Exception as e:
+            # Keep any partial file so the next run can resume from it
             print(f"✗ Failed to download {url}: {e}")
-            if output_path.exists():
-                output_path.unlink()
             return False
 
+    def _finish_download(
+        self, part_path: Path, output_path: Path, meta: RemoteMeta
+    ) -> bool:
+        """Move a complete, verified ``.part`` file into place."""
+        os.replace(part_path, output_path)
+        self._record_validator(output_path, meta)
+        print(f"✓ Downloaded: {output_path.name}")
+        return True
+
+    def _remote_meta(self, url: str) -> RemoteMeta:
+        """Fetch the metadata of a URL with a single HEAD request."""
+        try:
+            response = self.session.head(url, allow_redirects=True, timeout=10)
+            response.raise_for_status()
+        except requests.RequestException:
+            return RemoteMeta()
+
+        headers = response.headers
+        return RemoteMeta(
+            size=int(headers.get("content-length", 0)),
+            validator=headers.get("etag") or headers.get("last-modified"),
+            accepts_ranges=headers.get("accept-ranges", "").lower() == "bytes",
+        )
+
+    @staticmethod
+    def _validator_path(output_path: Path) -> Path:
+        """Where the remote validator of a finished download is kept."""
+        return output_path.with_suffix(".etag")
+
+    def _is_fresh(
+        self, output_path: Path, meta: RemoteMeta, expected_hash: str | None = None
+    ) -> bool:
+        """
+        Whether an existing download is still current.
+
+        An expected hash is authoritative. Without one, the file is current
+        if the remote validator matches the one recorded when it was
+        downloaded; when the server sends no validator there is nothing to
+        compare, so the existing file is kept. The size is not compared,
+        since finished files are moved into place whole and may since have
+        been trimmed.
+        """
+        if not output_path.exists():
+            return False
+        if expected_hash:
+            return _sha256_file(output_path) == expected_hash
+        if not meta.validator:
+            return True
+        validator_path = self._validator_path(output_path)
+        return validator_path.exists() and validator_path.read_text() == meta.validator
+
+    def _record_validator(self, output_path: Path, meta: RemoteMeta) -> None:
+        """Remember the validator of the remote file ``output_path`` came from."""
+        if meta.validator:
+            self._validator_path(output_path).write_text(meta.validator)
+
     def trim_video(
         self, input_path: Path, output_path: Path, start: float, duration: float
     ) -> bool:
@@ -144,6 +419,10 @@ class TestVideoDownloader:
             cmd = [
                 "ffmpeg",
                 "-y",
+                "-nostdin",
+                "-nostats",
+                "-loglevel",
+                "error",  # Keep captured stderr down to actual errors
                 "-ss",
                 str(start),
                 "-i",
@@ -155,11 +434,12 @@ class TestVideoDownloader:
                 str(output_path),
             ]
 
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = subprocess.run(
+                cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+            )
             if result.returncode == 0:
-                # Remove original and rename trimmed
-                input_path.unlink()
-                output_path.rename(input_path)
+                # Atomically replace original with trimmed
+                os.replace(output_path, input_path)
                 return True
             else:
                 print(f"✗ Failed to trim {input_path.name}: {result.stderr}")
@@ -169,41 +449,156 @@ class TestVideoDownloader:
             print(f"✗ Error trimming {input_path.name}: {e}")
             return False
 
+    @classmethod
+    def _prepare_jobs(cls) -> list[DownloadJob]:
+        """Classify every entry in TEST_VIDEOS into a flat list of jobs."""
+        jobs = []
+        for category, info in cls.TEST_VIDEOS.items():
+            for name, url in info["urls"].items():
+                # Determine output directory based on content type
+                if _RESOLUTION_NAME.search(name):
+                    dir_key = "resolutions"
+                elif "pattern" in category:
+                    dir_key = "patterns"
+                else:
+                    dir_key = "standard"
+
+                # Generate filename
+                ext = Path(urlparse(url).path).suffix or ".mp4"
+                jobs.append(
+                    DownloadJob(
+                        url=url,
+                        dir_key=dir_key,
+                        filename=f"{category}_{name}{ext}",
+                        trim=info.get("trim"),
+                    )
+                )
+
+        return jobs
+
+    def _trim_download(self, output_path: Path, trim: tuple[float, float]) -> bool:
+        """Trim a downloaded video in place to its configured segment."""
+        start, end = trim
+        duration = end - start
+        temp_path = output_path.with_suffix(".tmp" + output_path.suffix)
+        if self.trim_video(output_path, temp_path, start, duration):
+            print(f"   ✂ Trimmed {output_path.name} to {duration}s")
+            return True
+        return False
+
+    def _fetch_job(
+        self,
+        url: str,
+        output_path: Path,
+        trim: tuple[float, float] | None,
+        position: int,
+    ) -> bool:
+        """Fetch a planned job, trimming it to its configured segment."""
+        # One HEAD request serves both the freshness and the range checks
+        meta = self._remote_meta(url)
+        if self._is_fresh(output_path, meta):
+            # Already fetched and, if configured, trimmed
+            print(f"✓ Already exists: {output_path.name}")
+            return True
+
+        if trim and meta.accepts_ranges:
+            # FFmpeg can seek over HTTP, so only the needed bytes are fetched
+            start, end = trim
+            if self.download_segment(url, output_path, start, end - start):
+                self._record_validator(output_path, meta)
+                return True
+
+        if not self.download_file(url, output_path, position=position, meta=meta):
+            return False
+
+        return self._trim_download(output_path, trim) if trim else True
+
+    def download_segment(
+        self, url: str, output_path: Path, start: float, duration: float
+    ) -> bool:
+        """
+        Fetch only a segment of a remote video, letting FFmpeg seek over HTTP.
+
+        Args:
+            url: URL of a server that supports range requests
+            output_path: Path to save the segment
+            start: Start time in seconds
+            duration: Duration in seconds
+
+        Returns:
+            Success status
+        """
+        temp_path = output_path.with_suffix(".tmp" + output_path.suffix)
+
+        try:
+            cmd = [
+                "ffmpeg",
+                "-y",
+                "-nostdin",
+                "-nostats",
+                "-loglevel",
+                "error",
+                "-ss",
+                str(start),
+                "-i",
+                url,
+                "-t",
+                str(duration),
+                "-c",
+                "copy",  # Copy codecs (fast)
+                str(temp_path),
+            ]
+
+            result = subprocess.run(
+                cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+            )
+            if result.returncode == 0:
+                os.replace(temp_path, output_path)
+                print(f"✓ Downloaded {duration}s segment: {output_path.name}")
+                return True
+            else:
+                print(f"✗ Failed to fetch segment of {url}: {result.stderr}")
+
+        except Exception as e:
+            print(f"✗ Error fetching segment of {url}: {e}")
+
+        if temp_path.exists():
+            temp_path.unlink()
+        return False
+
     def download_all(self):
         """Download all test videos."""
         print("🎬 Downloading Open Source Test Videos...")
         print(f"📁 Output directory: {self.output_dir}")
         print(f"📊 Max size per file: {self.max_size_bytes / 1024 / 1024:.0f}MB\n")
 
-        # Download main test videos
         for category, info in self.TEST_VIDEOS.items():
             print(f"\n📦 Downloading {category}...")
             print(f"   License: {info['license']}")
             print(f"   {info['description']}\n")
 
-            for name, url in info["urls"].items():
-                # Determine output directory based on content type
-                if "1080p" in name or "720p" in name or "4k" in name:
-                    out_dir = self.dirs["resolutions"]
-                elif "pattern" in category:
-                    out_dir = self.dirs["patterns"]
-                else:
-                    out_dir = self.dirs["standard"]
-
-                # Generate filename
-                ext = Path(urlparse(url).path).suffix or ".mp4"
-                filename = f"{category}_{name}{ext}"
-                output_path = out_dir / filename
-
-                # Download file
-                if self.download_file(url, output_path):
-                    # Trim if specified
-                    if info.get("trim"):
-                        start, end = info["trim"]
-                        duration = end - start
-                        temp_path = output_path.with_suffix(".tmp" + output_path.suffix)
-                        if self.trim_video(output_path, temp_path, start, duration):
-                            print(f"   ✂ Trimmed to {duration}s")
+        # Downloads are network bound, so threads overlap their latency
+        jobs = self._prepare_jobs()
+        workers = max(1, min(self.max_workers, len(jobs)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(
+                    self._fetch_job,
+                    job.url,
+                    self.dirs[job.dir_key] / job.filename,
+                    job.trim,
+                    idx,
+                ): job
+                for idx, job in enumerate(jobs)
+            }
+
+            # One failed job must not stop the others or skip the manifest
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    job = futures[future]
+                    print(f"✗ Failed to fetch {job.filename} from {job.url}: {e}")
 
         print("\n✅ Download complete!")
         self.generate_manifest()
@@ -212,60 +607,119 @@ class TestVideoDownloader:
         """Generate a manifest of downloaded videos with metadata."""
         manifest = {"videos": [], "total_size_mb": 0, "categories": {}}
 
+        # Collect every video first so they can be probed as one batch; a
+        # single scandir pass yields type and stat without extra syscalls
+        video_files = []
         for category, dir_path in self.dirs.items():
             if not dir_path.exists():
                 continue
 
             manifest["categories"][category] = []
 
-            for video_file in dir_path.glob("*"):
-                if video_file.is_file() and video_file.suffix in [
-                    ".mp4",
-                    ".webm",
-                    ".mkv",
-                    ".mov",
-                    ".ogv",
-                ]:
-                    # Get video metadata using ffprobe
-                    metadata = self.get_video_metadata(video_file)
-
-                    video_info = {
-                        "path": str(video_file.relative_to(self.output_dir)),
-                        "category": category,
-                        "size_mb": video_file.stat().st_size / 1024 / 1024,
-                        "metadata": metadata,
-                    }
-
-                    manifest["videos"].append(video_info)
-                    manifest["categories"][category].append(video_info["path"])
-                    manifest["total_size_mb"] += video_info["size_mb"]
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    if entry.is_file() and Path(entry.name).suffix in VIDEO_EXTENSIONS:
+                        video_files.append((category, Path(entry.path), entry.stat()))
+
+        # Get video metadata using ffprobe
+        metadata = self.probe_videos(
+            {video_file: stat for _, video_file, stat in video_files}
+        )
+
+        for category, video_file, stat in video_files:
+            video_info = {
+                "path": str(video_file.relative_to(self.output_dir)),
+                "category": category,
+                "size_mb": stat.st_size / 1024 / 1024,
+                "metadata": metadata[video_file],
+            }
+
+            manifest["videos"].append(video_info)
+            manifest["categories"][category].append(video_info["path"])
+            manifest["total_size_mb"] += video_info["size_mb"]
 
         # Save manifest
         manifest_path = self.output_dir / "manifest.json"
-        with open(manifest_path, "w") as f:
-            json.dump(manifest, f, indent=2)
+        if HAS_ORJSON:
+            manifest_path.write_bytes(
+                orjson.dumps(manifest, option=orjson.OPT_INDENT_2)
+            )
+        else:
+            with open(manifest_path, "w") as f:
+                json.dump(manifest, f, indent=2)
 
         print(f"\n📋 Manifest saved to: {manifest_path}")
         print(f"   Total videos: {len(manifest['videos'])}")
         print(f"   Total size: {manifest['total_size_mb']:.1f}MB")
 
+    def probe_videos(self, videos: dict[Path, os.stat_result]) -> dict[Path, dict]:
+        """
+        Probe many videos concurrently, reusing cached results.
+
+        Results are cached in ``.ffprobe-cache.json`` keyed by path, mtime
+        and size, so unchanged files are never re-probed across runs.
+
+        Args:
+            videos: Videos to probe, mapped to their ``stat()`` results
+
+        Returns:
+            Mapping of video path to its metadata
+        """
+        cache_path = self.output_dir / ".ffprobe-cache.json"
+        try:
+            cache = json.loads(cache_path.read_text())
+        except (OSError, ValueError):
+            cache = {}
+
+        keys = {
+            path: f"{path}:{stat.st_mtime_ns}:{stat.st_size}"
+            for path, stat in videos.items()
+        }
+
+        misses = [path for path in videos if keys[path] not in cache]
+        if misses:
+            # subprocess.run releases the GIL, so threads overlap the probes
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                for path, metadata in zip(
+                    misses, executor.map(self.get_video_metadata, misses), strict=True
+                ):
+                    # Don't cache failed probes so they are retried next run
+                    if metadata:
+                        cache[keys[path]] = metadata
+
+            # Keep only current entries and swap the cache in atomically
+            cache = {key: cache[key] for key in keys.values() if key in cache}
+            temp_path = cache_path.with_suffix(".tmp")
+            temp_path.write_text(json.dumps(cache))
+            os.replace(temp_path, cache_path)
+
+        return {path: cache.get(keys[path], {}) for path in videos}
+
     def get_video_metadata(self, video_path: Path) -> dict:
         """Extract video metadata using ffprobe."""
         try:
+            # Ask only for the fields the manifest records
             cmd = [
                 "ffprobe",
                 "-v",
                 "quiet",
                 "-print_format",
                 "json",
-                "-show_format",
-                "-show_streams",
+                "-show_entries",
+                "format=duration,format_name:"
+                "stream=codec_type,codec_name,width,height,r_frame_rate,channels",
                 str(video_path),
             ]
 
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            # Read stdout as bytes and discard stderr; json parses bytes directly
+            result = subprocess.run(
+                cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+            )
             if result.returncode == 0:
-                data = json.loads(result.stdout)
+                if HAS_ORJSON:
+                    data = orjson.loads(result.stdout)
+                else:
+                    data = json.loads(result.stdout)
 
                 video_stream = next(
                     (s for s in data.get("streams", []) if s["codec_type"] == "video"),
@@ -282,7 +736,7 @@ class TestVideoDownloader:
                     "video_codec": video_stream.get("codec_name"),
                     "width": video_stream.get("width"),
                     "height": video_stream.get("height"),
-                    "fps": eval(video_stream.get("r_frame_rate", "0/1")),
+                    "fps": _parse_frame_rate(video_stream.get("r_frame_rate", "0/1")),
                     "audio_codec": audio_stream.get("codec_name"),
                     "audio_channels": audio_stream.get("channels"),
                     "format": data.get("format", {}).get("format_name"),
@@ -8,9 +8,15 @@ and spatial audio functionality.
 """
 
 import asyncio
+import contextvars
+import functools
 import json
 import logging
-import subprocess
+import os
+import shutil
+import sys
+import time
+from collections.abc import Iterable, Sequence
 from pathlib import Path
 
 import cv2
@@ -18,13 +24,50 @@ import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Header and progress lines of the stage running in the current task,
+# printed together when the stage finishes; unset outside generate_all
+_stage_lines: contextvars.ContextVar[list[str] | None] = contextvars.ContextVar(
+    "_stage_lines", default=None
+)
+
+
+async def _read_tail(stream: asyncio.StreamReader, limit: int = 8192) -> bytes:
+    """Drain ``stream`` to EOF, keeping only its last ``limit`` bytes."""
+    tail = bytearray()
+    while chunk := await stream.read(1 << 16):
+        tail += chunk
+        del tail[:-limit]
+    return bytes(tail)
+
+
+def _guarded(method):
+    """Record any error from a ``create_*`` method as a failed generation.
+
+    Outputs left by an earlier run are kept unless the generator is forced.
+    """
+
+    @functools.wraps(method)
+    async def wrapper(self, output_path: Path, *args, **kwargs):
+        if not self.force and output_path.exists() and output_path.stat().st_size > 0:
+            self._record_generated(output_path, cached=True)
+            return
+
+        try:
+            await method(self, output_path, *args, **kwargs)
+        except Exception as e:
+            logger.error(f"Generation failed for {output_path.name}: {e}")
+            self._record_failure({"file": str(output_path), "error": str(e)})
+
+    return wrapper
+
 
 class Synthetic360Generator:
     """Generate synthetic 360° test videos with controlled characteristics."""
 
-    def __init__(self, output_dir: Path):
+    def __init__(self, output_dir: Path, force: bool = False):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.force = force  # Regenerate videos that already exist
 
         # Create category directories
         self.dirs = {
@@ -41,26 +84,36 @@ class Synthetic360Generator:
         for dir_path in self.dirs.values():
             dir_path.mkdir(parents=True, exist_ok=True)
 
-        # Generation log
+        # Generation log; each result is also appended to log_file as it
+        # happens, so progress survives a crash
         self.generated_files = []
         self.failed_generations = []
+        self.log_file = self.output_dir / "generation_log.jsonl"
+        self.log_file.unlink(missing_ok=True)
+
+        # Fixtures only need to decode correctly, so favour encode speed
+        self._x264_args = [
+            "-c:v",
+            "libx264",
+            "-preset",
+            "ultrafast",
+            "-tune",
+            "zerolatency",
+            "-threads",
+            "1",
+            "-pix_fmt",
+            "yuv420p",
+        ]
+
+        # Stages run concurrently; each encoder is single-threaded, so run one
+        # per core and let that parallelism keep the CPU busy
+        self._ffmpeg_slots = asyncio.Semaphore(os.cpu_count() or 1)
 
     def check_dependencies(self) -> bool:
         """Check if required dependencies are available."""
-        dependencies = {
-            "ffmpeg": "ffmpeg -version",
-            "opencv": 'python -c "import cv2; print(cv2.__version__)"',
-            "numpy": 'python -c "import numpy; print(numpy.__version__)"',
-        }
-
-        missing = []
-        for name, cmd in dependencies.items():
-            try:
-                result = subprocess.run(cmd.split(), capture_output=True)
-                if result.returncode != 0:
-                    missing.append(name)
-            except FileNotFoundError:
-                missing.append(name)
+        # cv2 and numpy are imported at module load, so only FFmpeg can be
+        # missing here; a PATH lookup avoids spawning any processes
+        missing = [] if shutil.which("ffmpeg") else ["ffmpeg"]
 
         if missing:
             logger.error(f"Missing dependencies: {missing}")
@@ -78,29 +131,28 @@ class Synthetic360Generator:
         print("🎥 Generating Synthetic 360° Videos...")
 
         try:
-            # Equirectangular projection tests
-            await self.generate_equirectangular_tests()
-
-            # Cubemap projection tests
-            await self.generate_cubemap_tests()
-
-            # Stereoscopic tests
-            await self.generate_stereoscopic_tests()
-
-            # Projection conversion tests
-            await self.generate_projection_tests()
-
-            # Spatial audio tests
-            await self.generate_spatial_audio_tests()
-
-            # Motion analysis tests
-            await self.generate_motion_tests()
-
-            # Edge cases
-            await self.generate_360_edge_cases()
-
-            # Test patterns
-            await self.generate_pattern_tests()
+            # create_* methods record their own failures; anything else that
+            # escapes a stage is recorded without cancelling the other stages
+            stages = [
+                self.generate_equirectangular_tests,
+                self.generate_cubemap_tests,
+                self.generate_stereoscopic_tests,
+                self.generate_projection_tests,
+                self.generate_spatial_audio_tests,
+                self.generate_motion_tests,
+                self.generate_360_edge_cases,
+                self.generate_pattern_tests,
+            ]
+            results = await asyncio.gather(
+                *(self._run_stage(stage) for stage in stages), return_exceptions=True
+            )
+            for stage, result in zip(stages, results, strict=True):
+                if isinstance(result, Exception):
+                    logger.error(f"{stage.__name__} failed: {result}")
+                    print(f"❌ {stage.__name__} failed: {result}")
+                    self._record_failure(
+                        {"stage": stage.__name__, "error": str(result)}
+                    )
 
             # Save generation summary
             self.save_generation_summary()
@@ -113,9 +165,26 @@ class Synthetic360Generator:
             logger.error(f"Generation failed: {e}")
             print(f"❌ Generation failed: {e}")
 
+    @staticmethod
+    async def _run_stage(stage):
+        """Run a generation stage, printing its output when it ends.
+
+        Each stage runs in its own task, so its header and progress lines
+        are collected apart from the concurrent stages' and printed together
+        as one block.
+        """
+        lines: list[str] = []
+        _stage_lines.set(lines)
+        try:
+            await stage()
+        finally:
+            if lines:
+                sys.stdout.write("\n".join(lines) + "\n")
+                sys.stdout.flush()
+
     async def generate_equirectangular_tests(self):
         """Generate equirectangular projection test videos."""
-        print("\n📐 Generating Equirectangular Tests...")
+        self._report("\n📐 Generating Equirectangular Tests...")
         equirect_dir = self.dirs["equirectangular"]
 
         # Standard equirectangular resolutions
@@ -127,23 +196,24 @@ class Synthetic360Generator:
             ("4096x2048", "dci_4k_equirect.mp4", 3),
         ]
 
-        for resolution, filename, duration in resolutions:
-            await self.create_equirectangular_pattern(
-                equirect_dir / filename, resolution, duration
-            )
-
-        # Generate with grid pattern for distortion testing
-        await self.create_equirect_grid(equirect_dir / "grid_pattern.mp4")
-
-        # Moving object in 360 space
-        await self.create_moving_object_360(equirect_dir / "moving_object.mp4")
-
-        # Latitude/longitude test pattern
-        await self.create_lat_lon_pattern(equirect_dir / "lat_lon_test.mp4")
+        await asyncio.gather(
+            *(
+                self.create_equirectangular_pattern(
+                    equirect_dir / filename, resolution, duration
+                )
+                for resolution, filename, duration in resolutions
+            ),
+            # Generate with grid pattern for distortion testing
+            self.create_equirect_grid(equirect_dir / "grid_pattern.mp4"),
+            # Moving object in 360 space
+            self.create_moving_object_360(equirect_dir / "moving_object.mp4"),
+            # Latitude/longitude test pattern
+            self.create_lat_lon_pattern(equirect_dir / "lat_lon_test.mp4"),
+        )
 
     async def generate_cubemap_tests(self):
         """Generate cubemap projection test videos."""
-        print("\n🎲 Generating Cubemap Tests...")
+        self._report("\n🎲 Generating Cubemap Tests...")
         cubemap_dir = self.dirs["cubemap"]
 
         # Different cubemap layouts
@@ -154,37 +224,39 @@ class Synthetic360Generator:
             ("2x3", "cubemap_2x3.mp4"),  # Alternative layout
         ]
 
-        for layout, filename in layouts:
-            await self.create_cubemap_layout(cubemap_dir / filename, layout)
-
-        # EAC (Equi-Angular Cubemap) for YouTube
-        await self.create_eac_video(cubemap_dir / "eac_youtube.mp4")
-
-        # Cubemap with face labels
-        await self.create_labeled_cubemap(cubemap_dir / "labeled_faces.mp4")
+        await asyncio.gather(
+            *(
+                self.create_cubemap_layout(cubemap_dir / filename, layout)
+                for layout, filename in layouts
+            ),
+            # EAC (Equi-Angular Cubemap) for YouTube
+            self.create_eac_video(cubemap_dir / "eac_youtube.mp4"),
+            # Cubemap with face labels
+            self.create_labeled_cubemap(cubemap_dir / "labeled_faces.mp4"),
+        )
 
     async def generate_stereoscopic_tests(self):
         """Generate stereoscopic 360° test videos."""
-        print("\n👁️  Generating Stereoscopic Tests...")
+        self._report("\n👁️  Generating Stereoscopic Tests...")
         stereo_dir = self.dirs["stereoscopic"]
 
-        # Top-bottom stereo
-        await self.create_stereoscopic_video(stereo_dir / "stereo_tb.mp4", "top_bottom")
+        top_bottom = stereo_dir / "stereo_tb.mp4"
 
-        # Side-by-side stereo
-        await self.create_stereoscopic_video(
-            stereo_dir / "stereo_sbs.mp4", "left_right"
+        await asyncio.gather(
+            # Top-bottom stereo
+            self.create_stereoscopic_video(top_bottom, "top_bottom"),
+            # Side-by-side stereo
+            self.create_stereoscopic_video(stereo_dir / "stereo_sbs.mp4", "left_right"),
+            # VR180 (half sphere stereoscopic)
+            self.create_vr180_video(stereo_dir / "vr180.mp4"),
         )
 
-        # VR180 (half sphere stereoscopic)
-        await self.create_vr180_video(stereo_dir / "vr180.mp4")
-
-        # Stereoscopic with depth variation
-        await self.create_depth_test_stereo(stereo_dir / "depth_test.mp4")
+        # Stereoscopic with depth variation (same content as top-bottom)
+        self._link_video(stereo_dir / "depth_test.mp4", top_bottom)
 
     async def generate_projection_tests(self):
         """Generate videos for projection conversion testing."""
-        print("\n🔄 Generating Projection Conversion Tests...")
+        self._report("\n🔄 Generating Projection Conversion Tests...")
         proj_dir = self.dirs["projections"]
 
         # Different projection types for conversion testing
@@ -196,46 +268,55 @@ class Synthetic360Generator:
             ("cylindrical", "cylindrical_projection.mp4"),
         ]
 
-        for proj_type, filename in projections:
-            await self.create_projection_test(proj_dir / filename, proj_type)
+        await asyncio.gather(
+            *(
+                self.create_projection_test(proj_dir / filename, proj_type)
+                for proj_type, filename in projections
+            )
+        )
 
     async def generate_spatial_audio_tests(self):
         """Generate 360° videos with spatial audio."""
-        print("\n🔊 Generating Spatial Audio Tests...")
+        self._report("\n🔊 Generating Spatial Audio Tests...")
         audio_dir = self.dirs["spatial_audio"]
 
-        # Ambisonic audio (B-format)
-        await self.create_ambisonic_video(audio_dir / "ambisonic_bformat.mp4")
+        head_locked = audio_dir / "head_locked_stereo.mp4"
 
-        # Head-locked stereo audio
-        await self.create_head_locked_audio(audio_dir / "head_locked_stereo.mp4")
-
-        # Object-based spatial audio
-        await self.create_object_audio_360(audio_dir / "object_audio.mp4")
+        await asyncio.gather(
+            # Ambisonic audio (B-format)
+            self.create_ambisonic_video(audio_dir / "ambisonic_bformat.mp4"),
+            # Head-locked stereo audio
+            self.create_head_locked_audio(head_locked),
+        )
 
-        # Binaural audio test
-        await self.create_binaural_360(audio_dir / "binaural_test.mp4")
+        # Object-based spatial audio and binaural audio (same content as
+        # head-locked)
+        self._link_video(audio_dir / "object_audio.mp4", head_locked)
+        self._link_video(audio_dir / "binaural_test.mp4", head_locked)
 
     async def generate_motion_tests(self):
         """Generate videos for motion analysis testing."""
-        print("\n🏃 Generating Motion Analysis Tests...")
+        self._report("\n🏃 Generating Motion Analysis Tests...")
         motion_dir = self.dirs["motion_tests"]
 
-        # High motion content
-        await self.create_high_motion_360(motion_dir / "high_motion.mp4")
-
-        # Low motion content
-        await self.create_low_motion_360(motion_dir / "low_motion.mp4")
+        high_motion = motion_dir / "high_motion.mp4"
+        low_motion = motion_dir / "low_motion.mp4"
 
-        # Rotating camera movement
-        await self.create_camera_rotation(motion_dir / "camera_rotation.mp4")
+        await asyncio.gather(
+            # High motion content
+            self.create_high_motion_360(high_motion),
+            # Low motion content
+            self.create_low_motion_360(low_motion),
+        )
 
-        # Scene transitions
-        await self.create_scene_transitions(motion_dir / "scene_transitions.mp4")
+        # Rotating camera movement (same content as high motion)
+        self._link_video(motion_dir / "camera_rotation.mp4", high_motion)
+        # Scene transitions (same content as low motion)
+        self._link_video(motion_dir / "scene_transitions.mp4", low_motion)
 
     async def generate_360_edge_cases(self):
         """Generate edge case 360° videos."""
-        print("\n⚠️  Generating Edge Cases...")
+        self._report("\n⚠️  Generating Edge Cases...")
         edge_dir = self.dirs["edge_cases"]
 
         # Non-standard aspect ratios
@@ -246,776 +327,627 @@ class Synthetic360Generator:
             ("2048x4096", "ultra_tall_360.mp4"),
         ]
 
-        for resolution, filename in weird_ratios:
-            await self.create_unusual_aspect_ratio(edge_dir / filename, resolution)
-
-        # Incomplete sphere (180° video)
-        await self.create_180_video(edge_dir / "hemisphere_180.mp4")
-
-        # Tilted/rotated initial view
-        await self.create_tilted_view(edge_dir / "tilted_initial_view.mp4")
-
-        # Missing or corrupt metadata
-        await self.create_no_metadata_360(edge_dir / "no_metadata_360.mp4")
-
-        # Single frame 360° video
-        await self.create_single_frame_360(edge_dir / "single_frame.mp4")
+        await asyncio.gather(
+            *(
+                self.create_unusual_aspect_ratio(edge_dir / filename, resolution)
+                for resolution, filename in weird_ratios
+            ),
+            # Incomplete sphere (180° video)
+            self.create_180_video(edge_dir / "hemisphere_180.mp4"),
+            # Tilted/rotated initial view
+            self.create_tilted_view(edge_dir / "tilted_initial_view.mp4"),
+            # Missing or corrupt metadata
+            self.create_no_metadata_360(edge_dir / "no_metadata_360.mp4"),
+            # Single frame 360° video
+            self.create_single_frame_360(edge_dir / "single_frame.mp4"),
+        )
 
     async def generate_pattern_tests(self):
         """Generate test pattern videos."""
-        print("\n📊 Generating Test Patterns...")
+        self._report("\n📊 Generating Test Patterns...")
         pattern_dir = self.dirs["patterns"]
 
-        # Color test patterns
-        await self.create_color_bars_360(pattern_dir / "color_bars.mp4")
+        color_bars = pattern_dir / "color_bars.mp4"
 
-        # Resolution test pattern
-        await self.create_resolution_test(pattern_dir / "resolution_test.mp4")
+        # Color test patterns
+        await self.create_color_bars_360(color_bars)
 
-        # Geometric test patterns
-        await self.create_geometric_patterns(pattern_dir / "geometric_test.mp4")
+        # Resolution and geometric test patterns (same content as color bars)
+        self._link_video(pattern_dir / "resolution_test.mp4", color_bars)
+        self._link_video(pattern_dir / "geometric_test.mp4", color_bars)
 
     # =================================================================
     # Individual video generation methods
     # =================================================================
 
+    @_guarded
     async def create_equirectangular_pattern(
         self, output_path: Path, resolution: str, duration: int
     ):
         """Create basic equirectangular pattern using FFmpeg."""
-        try:
-            cmd = [
-                "ffmpeg",
-                "-f",
-                "lavfi",
-                "-i",
-                f"testsrc2=size={resolution}:duration={duration}:rate=30",
-                "-c:v",
-                "libx264",
-                "-preset",
-                "medium",
-                "-crf",
-                "23",
-                "-metadata",
-                "spherical=1",
-                "-metadata",
-                "projection=equirectangular",
-                str(output_path),
-                "-y",
-            ]
-
-            result = await asyncio.create_subprocess_exec(
-                *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
-            )
-            stdout, stderr = await result.communicate()
-
-            if result.returncode == 0:
-                self.generated_files.append(str(output_path))
-                print(f"  ✓ {output_path.name}")
-            else:
-                logger.error(f"FFmpeg failed: {stderr.decode()}")
-                self.failed_generations.append(
-                    {"file": str(output_path), "error": stderr.decode()}
-                )
+        cmd = self._build_cmd(
+            f"testsrc2=size={resolution}:duration={duration}:rate=30",
+            output_path,
+            metadata={"spherical": 1, "projection": "equirectangular"},
+        )
 
-        except Exception as e:
-            logger.error(f"Error generating {output_path}: {e}")
-            self.failed_generations.append({"file": str(output_path), "error": str(e)})
+        await self.run_ffmpeg_command(cmd, output_path)
 
+    @_guarded
     async def create_equirect_grid(self, output_path: Path):
         """Create equirectangular video with latitude/longitude grid using OpenCV."""
-        try:
-            width, height = 3840, 1920
-            fps = 30
-            duration = 5
+        width, height = 3840, 1920
+        fps = 30
+        duration = 5
+
+        # The grid is identical in every frame, so draw it once up front
+        base_img = np.full((height, width, 3), 20, dtype=np.uint8)
+
+        # Grid line positions: inverse equirectangular mapping of lat/lon
+        lats = np.arange(-90, 91, 15)
+        lat_ys = ((90 - lats) * height // 180).astype(np.int32)
+        lons = np.arange(-180, 181, 30)
+        lon_xs = ((lons + 180) * width // 360).astype(np.int32)
+
+        # One polyline per grid line, so each colour is a single OpenCV call
+        lat_lines = np.zeros((len(lats), 2, 2), dtype=np.int32)
+        lat_lines[:, 1, 0] = width
+        lat_lines[:, :, 1] = lat_ys[:, None]
+        lon_lines = np.zeros((len(lons), 2, 2), dtype=np.int32)
+        lon_lines[:, :, 0] = lon_xs[:, None]
+        lon_lines[:, 1, 1] = height
+
+        # Draw latitude lines (horizontal), bright green for the equator
+        equator = lats == 0
+        cv2.polylines(base_img, lat_lines[~equator], False, (0, 150, 0), 1)
+        cv2.polylines(base_img, lat_lines[equator], False, (0, 255, 0), 2)
+
+        # Draw longitude lines (vertical), bright red for the prime meridian
+        meridian = lons == 0
+        cv2.polylines(base_img, lon_lines[~meridian], False, (0, 0, 150), 1)
+        cv2.polylines(base_img, lon_lines[meridian], False, (0, 0, 255), 2)
+
+        # Add latitude labels
+        for lat, y in zip(lats, lat_ys, strict=True):
+            cv2.putText(
+                base_img,
+                f"{lat}°",
+                (20, y - 10),
+                cv2.FONT_HERSHEY_SIMPLEX,
+                0.7,
+                (0, 255, 0) if lat == 0 else (0, 150, 0),
+                2,
+            )
 
-            # Create video writer
-            fourcc = cv2.VideoWriter_fourcc(*"mp4v")
-            temp_path = output_path.with_suffix(".temp.mp4")
-            out = cv2.VideoWriter(str(temp_path), fourcc, fps, (width, height))
+        # Add longitude labels
+        for lon, x in zip(lons, lon_xs, strict=True):
+            cv2.putText(
+                base_img,
+                f"{lon}°",
+                (x + 5, 30),
+                cv2.FONT_HERSHEY_SIMPLEX,
+                0.7,
+                (0, 0, 255) if lon == 0 else (0, 0, 150),
+                2,
+            )
 
+        # Add title; only the frame number changes, so the prefix is drawn
+        # once and the number is placed at the prefix's advance width
+        title_prefix = "360° EQUIRECTANGULAR GRID TEST - Frame "
+        title_x, title_y = width // 2 - 300, height // 2
+        cv2.putText(
+            base_img,
+            title_prefix,
+            (title_x, title_y),
+            cv2.FONT_HERSHEY_SIMPLEX,
+            1,
+            (255, 255, 255),
+            2,
+        )
+        # getTextSize pads for thickness, so measure the prefix's advance
+        # as the difference between two widths
+        (with_digit, _), _ = cv2.getTextSize(
+            title_prefix + "0", cv2.FONT_HERSHEY_SIMPLEX, 1, 2
+        )
+        (digit, _), _ = cv2.getTextSize("0", cv2.FONT_HERSHEY_SIMPLEX, 1, 2)
+        number_x = title_x + with_digit - digit
+
+        # Marker trajectory for the whole clip, one orbit per second
+        angles = 2 * np.pi * np.arange(fps * duration) / fps
+        marker_xs = (width / 2 + 200 * np.cos(angles)).astype(np.int32)
+        marker_ys = (height / 2 + 100 * np.sin(angles)).astype(np.int32)
+
+        def frames():
+            # One scratch frame is reused; the pipe has taken a copy of each
+            # frame by the time the next one is requested
+            img = np.empty_like(base_img)
             for frame_num in range(fps * duration):
-                # Create base image
-                img = np.zeros((height, width, 3), dtype=np.uint8)
-                img.fill(20)  # Dark gray background
-
-                # Draw latitude lines (horizontal)
-                for lat in range(-90, 91, 15):
-                    y = int((90 - lat) / 180 * height)
-                    color = (
-                        (0, 255, 0) if lat == 0 else (0, 150, 0)
-                    )  # Bright green for equator
-                    thickness = 2 if lat == 0 else 1
-                    cv2.line(img, (0, y), (width, y), color, thickness)
-
-                    # Add latitude labels
-                    label = f"{lat}°"
-                    cv2.putText(
-                        img,
-                        label,
-                        (20, y - 10),
-                        cv2.FONT_HERSHEY_SIMPLEX,
-                        0.7,
-                        color,
-                        2,
-                    )
-
-                # Draw longitude lines (vertical)
-                for lon in range(-180, 181, 30):
-                    x = int((lon + 180) / 360 * width)
-                    color = (
-                        (0, 0, 255) if lon == 0 else (0, 0, 150)
-                    )  # Bright red for prime meridian
-                    thickness = 2 if lon == 0 else 1
-                    cv2.line(img, (x, 0), (x, height), color, thickness)
-
-                    # Add longitude labels
-                    label = f"{lon}°"
-                    cv2.putText(
-                        img, label, (x + 5, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.7, color, 2
-                    )
+                np.copyto(img, base_img)
 
                 # Add animated element
-                angle = (frame_num / fps) * 2 * np.pi
-                marker_x = int(width / 2 + 200 * np.cos(angle))
-                marker_y = int(height / 2 + 100 * np.sin(angle))
-                cv2.circle(img, (marker_x, marker_y), 20, (255, 255, 0), -1)
+                marker = (marker_xs[frame_num], marker_ys[frame_num])
+                cv2.circle(img, marker, 20, (255, 255, 0), -1)
 
-                # Add title
-                title = f"360° EQUIRECTANGULAR GRID TEST - Frame {frame_num}"
                 cv2.putText(
                     img,
-                    title,
-                    (width // 2 - 300, height // 2),
+                    str(frame_num),
+                    (number_x, title_y),
                     cv2.FONT_HERSHEY_SIMPLEX,
                     1,
                     (255, 255, 255),
                     2,
                 )
 
-                out.write(img)
-
-            out.release()
+                yield img
 
-            # Add metadata with FFmpeg
-            await self.add_spherical_metadata(temp_path, output_path)
-            temp_path.unlink()
-
-            self.generated_files.append(str(output_path))
-            print(f"  ✓ {output_path.name}")
+        # Encode the frames and attach the spherical metadata in one pass
+        cmd = self._build_cmd(
+            "pipe:0",
+            output_path,
+            metadata={"spherical": 1, "projection": "equirectangular"},
+            input_args=self._rawvideo_args(width, height, fps),
+        )
 
-        except Exception as e:
-            logger.error(f"Grid generation failed: {e}")
-            self.failed_generations.append({"file": str(output_path), "error": str(e)})
+        await self.run_ffmpeg_command(cmd, output_path, frames=frames())
 
+    @_guarded
     async def create_moving_object_360(self, output_path: Path):
         """Create 360° video with objects moving through the sphere."""
-        try:
-            cmd = [
-                "ffmpeg",
-                "-f",
-                "lavfi",
-                "-i",
-                "testsrc2=size=3840x1920:duration=8:rate=30",
-                "-vf",
-                "v360=e:e:yaw=t*45:pitch=sin(t*2)*30",  # Animated view
-                "-c:v",
-                "libx264",
-                "-metadata",
-                "spherical=1",
-                "-metadata",
-                "projection=equirectangular",
-                str(output_path),
-                "-y",
-            ]
-
-            await self.run_ffmpeg_command(cmd, output_path)
+        cmd = self._build_cmd(
+            "testsrc2=size=3840x1920:duration=8:rate=30",
+            output_path,
+            vf="v360=e:e:yaw=t*45:pitch=sin(t*2)*30",  # Animated view
+            metadata={"spherical": 1, "projection": "equirectangular"},
+        )
 
-        except Exception as e:
-            logger.error(f"Moving object generation failed: {e}")
-            self.failed_generations.append({"file": str(output_path), "error": str(e)})
+        await self.run_ffmpeg_command(cmd, output_path)
 
+    @_guarded
     async def create_lat_lon_pattern(self, output_path: Path):
         """Create latitude/longitude test pattern."""
-        try:
-            # Use drawgrid filter to create precise grid
-            cmd = [
-                "ffmpeg",
-                "-f",
-                "lavfi",
-                "-i",
-                "color=c=blue:size=3840x1920:duration=4",
-                "-vf",
-                "drawgrid=w=iw/12:h=ih/6:t=2:c=white@0.5",
-                "-c:v",
-                "libx264",
-                "-metadata",
-                "spherical=1",
-                "-metadata",
-                "projection=equirectangular",
-                str(output_path),
-                "-y",
-            ]
-
-            await self.run_ffmpeg_command(cmd, output_path)
+        # Use drawgrid filter to create precise grid
+        cmd = self._build_cmd(
+            "color=c=blue:size=3840x1920:duration=4",
+            output_path,
+            vf="drawgrid=w=iw/12:h=ih/6:t=2:c=white@0.5",
+            metadata={"spherical": 1, "projection": "equirectangular"},
+        )
 
-        except Exception as e:
-            logger.error(f"Lat/lon pattern failed: {e}")
-            self.failed_generations.append({"file": str(output_path), "error": str(e)})
+        await self.run_ffmpeg_command(cmd, output_path)
 
+    @_guarded
     async def create_cubemap_layout(self, output_path: Path, layout: str):
         """Create cubemap with specified layout."""
-        try:
-            cols, rows = map(int, layout.split("x"))
-            face_size = 1024
-            width = face_size * cols
-            height = face_size * rows
-
-            cmd = [
-                "ffmpeg",
-                "-f",
-                "lavfi",
-                "-i",
-                f"testsrc2=size={width}x{height}:duration=3:rate=30",
-                "-vf",
-                f"v360=e:c{layout}",
-                "-c:v",
-                "libx264",
-                "-metadata",
-                "spherical=1",
-                "-metadata",
-                "projection=cubemap",
-                str(output_path),
-                "-y",
-            ]
-
-            await self.run_ffmpeg_command(cmd, output_path)
+        cols, rows = map(int, layout.split("x"))
+        face_size = 1024
+        width = face_size * cols
+        height = face_size * rows
+
+        cmd = self._build_cmd(
+            f"testsrc2=size={width}x{height}:duration=3:rate=30",
+            output_path,
+            vf=f"v360=e:c{layout}",
+            metadata={"spherical": 1, "projection": "cubemap"},
+        )
 
-        except Exception as e:
-            logger.error(f"Cubemap {layout} failed: {e}")
-            self.failed_generations.append({"file": str(output_path), "error": str(e)})
+        await self.run_ffmpeg_command(cmd, output_path)
 
+    @_guarded
     async def create_eac_video(self, output_path: Path):
         """Create Equi-Angular Cubemap video."""
-        try:
-            cmd = [
-                "ffmpeg",
-                "-f",
-                "lavfi",
-                "-i",
-                "testsrc2=size=3840x1920:duration=3:rate=30",
-                "-vf",
-                "v360=e:eac",
-                "-c:v",
-                "libx264",
-                "-metadata",
-                "spherical=1",
-                "-metadata",
-                "projection=eac",
-                str(output_path),
-                "-y",
-            ]
-
-            await self.run_ffmpeg_command(cmd, output_path)
+        cmd = self._build_cmd(
+            "testsrc2=size=3840x1920:duration=3:rate=30",
+            output_path,
+            vf="v360=e:eac",
+            metadata={"spherical": 1, "projection": "eac"},
+        )
 
-        except Exception as e:
-            logger.error(f"EAC generation failed: {e}")
-            self.failed_generations.append({"file": str(output_path), "error": str(e)})
+        await self.run_ffmpeg_command(cmd, output_path)
 
+    @_guarded
     async def create_labeled_cubemap(self, output_path: Path):
         """Create cubemap with labeled faces."""
-        try:
-            # Create image sequence with face labels using OpenCV
-            temp_dir = output_path.parent / "temp_cubemap"
-            temp_dir.mkdir(exist_ok=True)
-
-            face_names = ["FRONT", "RIGHT", "BACK", "LEFT", "TOP", "BOTTOM"]
-            colors = [
-                (255, 0, 0),
-                (0, 255, 0),
-                (0, 0, 255),
-                (255, 255, 0),
-                (255, 0, 255),
-                (0, 255, 255),
-            ]
-
-            face_size = 512
-            duration = 3
-            fps = 30
+        face_names = ["FRONT", "RIGHT", "BACK", "LEFT", "TOP", "BOTTOM"]
+        colors = [
+            (255, 0, 0),
+            (0, 255, 0),
+            (0, 0, 255),
+            (255, 255, 0),
+            (255, 0, 255),
+            (0, 255, 255),
+        ]
 
-            for frame_num in range(fps * duration):
-                # Create 3x2 cubemap layout
-                img = np.zeros((face_size * 2, face_size * 3, 3), dtype=np.uint8)
-
-                # Layout: [LEFT][FRONT][RIGHT]
-                #         [BOTTOM][TOP][BACK]
-                positions = [
-                    (1, 0),  # FRONT
-                    (2, 0),  # RIGHT
-                    (2, 1),  # BACK
-                    (0, 0),  # LEFT
-                    (1, 1),  # TOP
-                    (0, 1),  # BOTTOM
-                ]
-
-                for i, (face_name, color) in enumerate(
-                    zip(face_names, colors, strict=False)
-                ):
-                    col, row = positions[i]
-                    x1, y1 = col * face_size, row * face_size
-                    x2, y2 = x1 + face_size, y1 + face_size
-
-                    # Fill face with color
-                    img[y1:y2, x1:x2] = color
-
-                    # Add face label
-                    text_size = cv2.getTextSize(
-                        face_name, cv2.FONT_HERSHEY_SIMPLEX, 2, 3
-                    )[0]
-                    text_x = x1 + (face_size - text_size[0]) // 2
-                    text_y = y1 + (face_size + text_size[1]) // 2
-                    cv2.putText(
-                        img,
-                        face_name,
-                        (text_x, text_y),
-                        cv2.FONT_HERSHEY_SIMPLEX,
-                        2,
-                        (255, 255, 255),
-                        3,
-                    )
+        face_size = 512
+        duration = 3
+        fps = 30
+
+        # Layout: [LEFT][FRONT][RIGHT]
+        #         [BOTTOM][TOP][BACK]
+        positions = [
+            (1, 0),  # FRONT
+            (2, 0),  # RIGHT
+            (2, 1),  # BACK
+            (0, 0),  # LEFT
+            (1, 1),  # TOP
+            (0, 1),  # BOTTOM
+        ]
 
-                # Save frame
-                frame_path = temp_dir / f"frame_{frame_num:04d}.png"
-                cv2.imwrite(str(frame_path), img)
-
-            # Convert to video with FFmpeg
-            cmd = [
-                "ffmpeg",
-                "-framerate",
-                str(fps),
-                "-i",
-                str(temp_dir / "frame_%04d.png"),
-                "-c:v",
-                "libx264",
-                "-metadata",
-                "spherical=1",
-                "-metadata",
-                "projection=cubemap",
-                str(output_path),
-                "-y",
-            ]
+        # Nothing is animated, so draw the 3x2 cubemap layout once. Viewing
+        # the canvas as (rows, face, cols, face, bgr) fills every face with
+        # a single broadcast from the per-face colour grid.
+        face_colors = np.empty((2, 3, 3), dtype=np.uint8)
+        for (col, row), color in zip(positions, colors, strict=True):
+            face_colors[row, col] = color
+        base_cube = np.empty((face_size * 2, face_size * 3, 3), dtype=np.uint8)
+        base_cube.reshape(2, face_size, 3, face_size, 3)[:] = face_colors[
+            :, None, :, None, :
+        ]
 
-            await self.run_ffmpeg_command(cmd, output_path)
+        for face_name, (col, row) in zip(face_names, positions, strict=True):
+            x1, y1 = col * face_size, row * face_size
 
-            # Cleanup temp files
-            import shutil
+            # Add face label
+            (text_w, text_h), _ = cv2.getTextSize(
+                face_name, cv2.FONT_HERSHEY_SIMPLEX, 2, 3
+            )
+            text_x = x1 + (face_size - text_w) // 2
+            text_y = y1 + (face_size + text_h) // 2
+            cv2.putText(
+                base_cube,
+                face_name,
+                (text_x, text_y),
+                cv2.FONT_HERSHEY_SIMPLEX,
+                2,
+                (255, 255, 255),
+                3,
+            )
 
-            shutil.rmtree(temp_dir)
+        # Send the single frame once and let FFmpeg's loop filter repeat it
+        cmd = self._build_cmd(
+            "pipe:0",
+            output_path,
+            vf=f"loop=loop={fps * duration - 1}:size=1",
+            metadata={"spherical": 1, "projection": "cubemap"},
+            input_args=self._rawvideo_args(face_size * 3, face_size * 2, fps),
+        )
 
-        except Exception as e:
-            logger.error(f"Labeled cubemap failed: {e}")
-            self.failed_generations.append({"file": str(output_path), "error": str(e)})
+        await self.run_ffmpeg_command(cmd, output_path, frames=[base_cube])
 
+    @_guarded
     async def create_stereoscopic_video(self, output_path: Path, stereo_mode: str):
         """Create stereoscopic 360° video."""
-        try:
-            if stereo_mode == "top_bottom":
-                size = "3840x3840"  # Double height for TB
-                metadata_mode = "top_bottom"
-            else:  # left_right
-                size = "7680x1920"  # Double width for SBS
-                metadata_mode = "left_right"
-
-            cmd = [
-                "ffmpeg",
-                "-f",
-                "lavfi",
-                "-i",
-                f"testsrc2=size={size}:duration=3:rate=30",
-                "-c:v",
-                "libx264",
-                "-metadata",
-                "spherical=1",
-                "-metadata",
-                "projection=equirectangular",
-                "-metadata",
-                f"stereo_mode={metadata_mode}",
-                str(output_path),
-                "-y",
-            ]
-
-            await self.run_ffmpeg_command(cmd, output_path)
+        if stereo_mode == "top_bottom":
+            size = "3840x3840"  # Double height for TB
+            metadata_mode = "top_bottom"
+        else:  # left_right
+            size = "7680x1920"  # Double width for SBS
+            metadata_mode = "left_right"
+
+        cmd = self._build_cmd(
+            f"testsrc2=size={size}:duration=3:rate=30",
+            output_path,
+            metadata={
+                "spherical": 1,
+                "projection": "equirectangular",
+                "stereo_mode": metadata_mode,
+            },
+        )
 
-        except Exception as e:
-            logger.error(f"Stereoscopic {stereo_mode} failed: {e}")
-            self.failed_generations.append({"file": str(output_path), "error": str(e)})
+        await self.run_ffmpeg_command(cmd, output_path)
 
+    @_guarded
     async def create_vr180_video(self, output_path: Path):
         """Create VR180 (half-sphere stereoscopic) video."""
-        try:
-            cmd = [
-                "ffmpeg",
-                "-f",
-                "lavfi",
-                "-i",
-                "testsrc2=size=3840x3840:duration=3:rate=30",
-                "-c:v",
-                "libx264",
-                "-metadata",
-                "spherical=1",
-                "-metadata",
-                "projection=half_equirectangular",
-                "-metadata",
-                "stereo_mode=top_bottom",
-                "-metadata",
-                "fov_horizontal=180",
-                "-metadata",
-                "fov_vertical=180",
-                str(output_path),
-                "-y",
-            ]
-
-            await self.run_ffmpeg_command(cmd, output_path)
+        cmd = self._build_cmd(
+            "testsrc2=size=3840x3840:duration=3:rate=30",
+            output_path,
+            metadata={
+                "spherical": 1,
+                "projection": "half_equirectangular",
+                "stereo_mode": "top_bottom",
+                "fov_horizontal": 180,
+                "fov_vertical": 180,
+            },
+        )
 
-        except Exception as e:
-            logger.error(f"VR180 generation failed: {e}")
-            self.failed_generations.append({"file": str(output_path), "error": str(e)})
+        await self.run_ffmpeg_command(cmd, output_path)
 
+    @_guarded
     async def create_ambisonic_video(self, output_path: Path):
         """Create video with ambisonic B-format audio."""
-        try:
-            cmd = [
-                "ffmpeg",
-                "-f",
-                "lavfi",
-                "-i",
-                "testsrc2=size=3840x1920:duration=5:rate=30",
-                "-f",
-                "lavfi",
-                "-i",
+        cmd = self._build_cmd(
+            "testsrc2=size=3840x1920:duration=5:rate=30",
+            output_path,
+            metadata={
+                "spherical": 1,
+                "projection": "equirectangular",
+                "audio_type": "ambisonic",
+                "audio_channels": 4,
+            },
+            audio_srcs=[
                 "sine=frequency=440:duration=5",  # W (omni)
-                "-f",
-                "lavfi",
-                "-i",
                 "sine=frequency=550:duration=5",  # X (front-back)
-                "-f",
-                "lavfi",
-                "-i",
                 "sine=frequency=660:duration=5",  # Y (left-right)
-                "-f",
-                "lavfi",
-                "-i",
                 "sine=frequency=770:duration=5",  # Z (up-down)
-                "-map",
-                "0:v",
-                "-map",
-                "1:a",
-                "-map",
-                "2:a",
-                "-map",
-                "3:a",
-                "-map",
-                "4:a",
-                "-c:v",
-                "libx264",
-                "-c:a",
-                "aac",
-                "-metadata",
-                "spherical=1",
-                "-metadata",
-                "projection=equirectangular",
-                "-metadata",
-                "audio_type=ambisonic",
-                "-metadata",
-                "audio_channels=4",
-                str(output_path),
-                "-y",
-            ]
-
-            await self.run_ffmpeg_command(cmd, output_path)
+            ],
+        )
 
-        except Exception as e:
-            logger.error(f"Ambisonic video failed: {e}")
-            self.failed_generations.append({"file": str(output_path), "error": str(e)})
+        await self.run_ffmpeg_command(cmd, output_path)
 
     # =================================================================
     # Utility methods
     # =================================================================
 
-    async def run_ffmpeg_command(self, cmd: list[str], output_path: Path):
-        """Run FFmpeg command and handle results."""
-        result = await asyncio.create_subprocess_exec(
-            *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
-        )
-        stdout, stderr = await result.communicate()
+    def _build_cmd(
+        self,
+        video_src: str,
+        output_path: Path,
+        vf: str | None = None,
+        metadata: dict[str, str | int] | None = None,
+        audio_srcs: Sequence[str] = (),
+        input_args: Sequence[str] = ("-f", "lavfi"),
+    ) -> list[str]:
+        """Build an FFmpeg command that encodes ``video_src`` to ``output_path``.
+
+        ``video_src`` is a lavfi source unless ``input_args`` says otherwise;
+        ``audio_srcs`` are always lavfi sources and are muxed in as AAC.
+        """
+        # Only errors are kept so stderr stays small enough to buffer whole
+        cmd = ["ffmpeg", "-hide_banner", "-loglevel", "error"]
+        cmd += [*input_args, "-i", video_src]
+        for audio_src in audio_srcs:
+            cmd += ["-f", "lavfi", "-i", audio_src]
+        if audio_srcs:
+            cmd += ["-map", "0:v"]
+            for index in range(1, len(audio_srcs) + 1):
+                cmd += ["-map", f"{index}:a"]
+        if vf:
+            cmd += ["-vf", vf]
+        cmd += self._x264_args
+        if audio_srcs:
+            cmd += ["-c:a", "aac"]
+        for key, value in (metadata or {}).items():
+            cmd += ["-metadata", f"{key}={value}"]
+        cmd += [str(output_path), "-y"]
+        return cmd
+
+    @staticmethod
+    def _rawvideo_args(width: int, height: int, fps: int) -> list[str]:
+        """Input arguments for BGR frames piped in by ``run_ffmpeg_command``."""
+        return [
+            "-f",
+            "rawvideo",
+            "-pixel_format",
+            "bgr24",
+            "-video_size",
+            f"{width}x{height}",
+            "-framerate",
+            str(fps),
+        ]
+
+    async def run_ffmpeg_command(
+        self,
+        cmd: list[str],
+        output_path: Path,
+        frames: Iterable[np.ndarray] | None = None,
+    ):
+        """Run FFmpeg command and handle results.
+
+        If ``frames`` is given, each array is written to the process's stdin,
+        so ``cmd`` should read raw video from ``pipe:0``. The iterable is
+        advanced in a worker thread, so it may do blocking rendering work.
+        """
+        async with self._ffmpeg_slots:
+            result = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdin=asyncio.subprocess.PIPE if frames is not None else None,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE,
+                limit=1 << 20,
+            )
+            # Drain stderr as it arrives so FFmpeg never blocks on a full pipe
+            stderr_tail = asyncio.create_task(_read_tail(result.stderr))
+            if frames is not None:
+                # Frames are drawn in a worker thread so OpenCV rendering does
+                # not stall the other generators sharing the event loop
+                frame_iter = iter(frames)
+                try:
+                    while (
+                        frame := await asyncio.to_thread(next, frame_iter, None)
+                    ) is not None:
+                        result.stdin.write(frame.data.cast("B"))
+                        await result.stdin.drain()
+                except (BrokenPipeError, ConnectionResetError):
+                    pass  # FFmpeg exited early; its stderr says why
+                result.stdin.close()
+            await result.wait()
+            stderr = await stderr_tail
 
         if result.returncode == 0:
-            self.generated_files.append(str(output_path))
-            print(f"  ✓ {output_path.name}")
+            self._record_generated(output_path)
         else:
-            logger.error(f"FFmpeg failed for {output_path.name}: {stderr.decode()}")
-            self.failed_generations.append(
-                {"file": str(output_path), "error": stderr.decode()}
-            )
+            # Drop any partial output so the next run doesn't keep it
+            output_path.unlink(missing_ok=True)
+
+            # The tail may start mid-character
+            error = stderr.decode(errors="replace")
+            logger.error(f"FFmpeg failed for {output_path.name}: {error}")
+            self._record_failure({"file": str(output_path), "error": error})
+
+    def _link_video(self, output_path: Path, source: Path):
+        """Hardlink an already generated ``source`` video to ``output_path``.
+
+        Used for outputs whose content is identical to another video, so it
+        is not encoded twice. Nothing is linked if ``source`` failed, since
+        that failure is already recorded.
+        """
+        if str(source) not in self.generated_files:
+            return
 
-    async def add_spherical_metadata(self, input_path: Path, output_path: Path):
-        """Add spherical metadata to video file."""
-        cmd = [
-            "ffmpeg",
-            "-i",
-            str(input_path),
-            "-c",
-            "copy",
-            "-metadata",
-            "spherical=1",
-            "-metadata",
-            "projection=equirectangular",
-            str(output_path),
-            "-y",
-        ]
+        output_path.unlink(missing_ok=True)
+        try:
+            os.link(source, output_path)
+        except OSError:
+            shutil.copy2(source, output_path)  # e.g. no hardlink support
+
+        self._record_generated(output_path)
+
+    def _record_generated(self, output_path: Path, cached: bool = False):
+        """Record a finished video in the results and the generation log."""
+        self.generated_files.append(str(output_path))
+        suffix = " (cached)" if cached else ""
+        self._report(f"  ✓ {output_path.name}{suffix}")
+        self._append_log({"file": str(output_path), "cached": cached})
+
+    @staticmethod
+    def _report(line: str):
+        """Print a progress line, holding it back until the current stage ends."""
+        lines = _stage_lines.get()
+        if lines is None:
+            print(line)
+        else:
+            lines.append(line)
 
-        result = await asyncio.create_subprocess_exec(
-            *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
-        )
-        await result.communicate()
+    def _record_failure(self, failure: dict[str, str]):
+        """Record a failed video or stage in the results and the generation log."""
+        self.failed_generations.append(failure)
+        self._append_log(failure)
 
-    # Placeholder methods for remaining generators
-    async def create_depth_test_stereo(self, output_path: Path):
-        """Create stereoscopic video with depth testing."""
-        await self.create_stereoscopic_video(output_path, "top_bottom")
+    def _append_log(self, entry: dict):
+        """Append one timestamped JSON line to the generation log."""
+        with open(self.log_file, "a") as f:
+            f.write(json.dumps({**entry, "timestamp": time.time()}) + "\n")
 
+    # Placeholder methods for remaining generators
+    @_guarded
     async def create_projection_test(self, output_path: Path, proj_type: str):
         """Create video for projection testing."""
-        cmd = [
-            "ffmpeg",
-            "-f",
-            "lavfi",
-            "-i",
-            "testsrc2=size=2048x2048:duration=2:rate=30",
-            "-c:v",
-            "libx264",
-            str(output_path),
-            "-y",
-        ]
+        cmd = self._build_cmd("testsrc2=size=2048x2048:duration=2:rate=30", output_path)
         await self.run_ffmpeg_command(cmd, output_path)
 
+    @_guarded
     async def create_head_locked_audio(self, output_path: Path):
         """Create head-locked stereo audio."""
-        cmd = [
-            "ffmpeg",
-            "-f",
-            "lavfi",
-            "-i",
+        cmd = self._build_cmd(
             "testsrc2=size=3840x1920:duration=5:rate=30",
-            "-f",
-            "lavfi",
-            "-i",
-            "sine=frequency=440:duration=5",
-            "-c:v",
-            "libx264",
-            "-c:a",
-            "aac",
-            "-metadata",
-            "spherical=1",
-            "-metadata",
-            "audio_type=head_locked",
-            str(output_path),
-            "-y",
-        ]
+            output_path,
+            metadata={"spherical": 1, "audio_type": "head_locked"},
+            audio_srcs=["sine=frequency=440:duration=5"],
+        )
         await self.run_ffmpeg_command(cmd, output_path)
 
-    async def create_object_audio_360(self, output_path: Path):
-        """Create object-based spatial audio."""
-        await self.create_head_locked_audio(output_path)  # Simplified
-
-    async def create_binaural_360(self, output_path: Path):
-        """Create binaural 360° audio."""
-        await self.create_head_locked_audio(output_path)  # Simplified
-
+    @_guarded
     async def create_high_motion_360(self, output_path: Path):
         """Create high motion 360° content."""
-        cmd = [
-            "ffmpeg",
-            "-f",
-            "lavfi",
-            "-i",
+        cmd = self._build_cmd(
             "testsrc2=size=3840x1920:duration=5:rate=60",
-            "-vf",
-            "v360=e:e:yaw=t*180:pitch=sin(t*4)*45",  # Fast rotation
-            "-c:v",
-            "libx264",
-            "-metadata",
-            "spherical=1",
-            str(output_path),
-            "-y",
-        ]
+            output_path,
+            vf="v360=e:e:yaw=t*180:pitch=sin(t*4)*45",  # Fast rotation
+            metadata={"spherical": 1},
+        )
         await self.run_ffmpeg_command(cmd, output_path)
 
+    @_guarded
     async def create_low_motion_360(self, output_path: Path):
         """Create low motion 360° content."""
-        cmd = [
-            "ffmpeg",
-            "-f",
-            "lavfi",
-            "-i",
+        cmd = self._build_cmd(
             "testsrc2=size=3840x1920:duration=8:rate=30",
-            "-c:v",
-            "libx264",
-            "-metadata",
-            "spherical=1",
-            str(output_path),
-            "-y",
-        ]
+            output_path,
+            metadata={"spherical": 1},
+        )
         await self.run_ffmpeg_command(cmd, output_path)
 
-    async def create_camera_rotation(self, output_path: Path):
-        """Create camera rotation test."""
-        await self.create_high_motion_360(output_path)  # Simplified
-
-    async def create_scene_transitions(self, output_path: Path):
-        """Create scene transition test."""
-        await self.create_low_motion_360(output_path)  # Simplified
-
+    @_guarded
     async def create_unusual_aspect_ratio(self, output_path: Path, resolution: str):
         """Create video with unusual aspect ratio."""
-        cmd = [
-            "ffmpeg",
-            "-f",
-            "lavfi",
-            "-i",
+        cmd = self._build_cmd(
             f"testsrc2=size={resolution}:duration=2:rate=30",
-            "-c:v",
-            "libx264",
-            "-metadata",
-            "spherical=1",
-            str(output_path),
-            "-y",
-        ]
+            output_path,
+            metadata={"spherical": 1},
+        )
         await self.run_ffmpeg_command(cmd, output_path)
 
+    @_guarded
     async def create_180_video(self, output_path: Path):
         """Create 180° hemisphere video."""
-        cmd = [
-            "ffmpeg",
-            "-f",
-            "lavfi",
-            "-i",
+        cmd = self._build_cmd(
             "testsrc2=size=2048x2048:duration=3:rate=30",
-            "-c:v",
-            "libx264",
-            "-metadata",
-            "spherical=1",
-            "-metadata",
-            "projection=half_equirectangular",
-            "-metadata",
-            "fov_horizontal=180",
-            "-metadata",
-            "fov_vertical=180",
-            str(output_path),
-            "-y",
-        ]
+            output_path,
+            metadata={
+                "spherical": 1,
+                "projection": "half_equirectangular",
+                "fov_horizontal": 180,
+                "fov_vertical": 180,
+            },
+        )
         await self.run_ffmpeg_command(cmd, output_path)
 
+    @_guarded
     async def create_tilted_view(self, output_path: Path):
         """Create video with tilted initial view."""
-        cmd = [
-            "ffmpeg",
-            "-f",
-            "lavfi",
-            "-i",
+        cmd = self._build_cmd(
             "testsrc2=size=3840x1920:duration=2:rate=30",
-            "-c:v",
-            "libx264",
-            "-metadata",
-            "spherical=1",
-            "-metadata",
-            "initial_view_heading_degrees=45",
-            "-metadata",
-            "initial_view_pitch_degrees=30",
-            "-metadata",
-            "initial_view_roll_degrees=15",
-            str(output_path),
-            "-y",
-        ]
+            output_path,
+            metadata={
+                "spherical": 1,
+                "initial_view_heading_degrees": 45,
+                "initial_view_pitch_degrees": 30,
+                "initial_view_roll_degrees": 15,
+            },
+        )
         await self.run_ffmpeg_command(cmd, output_path)
 
+    @_guarded
     async def create_no_metadata_360(self, output_path: Path):
         """Create 360° video without metadata."""
-        cmd = [
-            "ffmpeg",
-            "-f",
-            "lavfi",
-            "-i",
-            "testsrc2=size=3840x1920:duration=2:rate=30",
-            "-c:v",
-            "libx264",
-            str(output_path),
-            "-y",  # No metadata
-        ]
+        # No metadata
+        cmd = self._build_cmd("testsrc2=size=3840x1920:duration=2:rate=30", output_path)
         await self.run_ffmpeg_command(cmd, output_path)
 
+    @_guarded
     async def create_single_frame_360(self, output_path: Path):
         """Create single frame 360° video."""
-        cmd = [
-            "ffmpeg",
-            "-f",
-            "lavfi",
-            "-i",
+        cmd = self._build_cmd(
             "testsrc2=size=3840x1920:duration=0.1:rate=30",
-            "-c:v",
-            "libx264",
-            "-metadata",
-            "spherical=1",
-            str(output_path),
-            "-y",
-        ]
+            output_path,
+            metadata={"spherical": 1},
+        )
         await self.run_ffmpeg_command(cmd, output_path)
 
+    @_guarded
     async def create_color_bars_360(self, output_path: Path):
         """Create color bars test pattern."""
-        cmd = [
-            "ffmpeg",
-            "-f",
-            "lavfi",
-            "-i",
+        cmd = self._build_cmd(
             "smptebars=size=3840x1920:duration=3:rate=30",
-            "-c:v",
-            "libx264",
-            "-metadata",
-            "spherical=1",
-            str(output_path),
-            "-y",
-        ]
+            output_path,
+            metadata={"spherical": 1},
+        )
         await self.run_ffmpeg_command(cmd, output_path)
 
-    async def create_resolution_test(self, output_path: Path):
-        """Create resolution test pattern."""
-        await self.create_color_bars_360(output_path)  # Simplified
-
-    async def create_geometric_patterns(self, output_path: Path):
-        """Create geometric test patterns."""
-        await self.create_color_bars_360(output_path)  # Simplified
-
     def save_generation_summary(self):
-        """Save generation summary to JSON."""
+        """Save generation summary to JSON.
+
+        Only totals are saved; per-file results are in the generation log.
+        """
         summary = {
             "timestamp": time.time(),
             "generated": len(self.generated_files),
             "failed": len(self.failed_generations),
-            "files": self.generated_files,
-            "failures": self.failed_generations,
+            "log": self.log_file.name,
             "directories": {k: str(v) for k, v in self.dirs.items()},
         }
 
+        # Write to a temp file and swap it in so readers never see a partial
+        # summary
         summary_file = self.output_dir / "generation_summary.json"
-        with open(summary_file, "w") as f:
-            json.dump(summary, f, indent=2)
+        temp_path = summary_file.with_suffix(".tmp")
+        temp_path.write_text(json.dumps(summary, indent=2))
+        os.replace(temp_path, summary_file)
 
 
 async def main():
     """Generate synthetic 360° test videos."""
     import argparse
-    import time
 
     parser = argparse.ArgumentParser(description="Generate synthetic 360° test videos")
     parser.add_argument(
@@ -1027,6 +959,11 @@ async def main():
     parser.add_argument(
         "--verbose", "-v", action="store_true", help="Enable verbose logging"
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenerate videos even if they already exist",
+    )
 
     args = parser.parse_args()
 
@@ -1035,7 +972,7 @@ async def main():
     logging.basicConfig(level=log_level, format="%(levelname)s: %(message)s")
 
     output_dir = Path(args.output_dir)
-    generator = Synthetic360Generator(output_dir)
+    generator = Synthetic360Generator(output_dir, force=args.force)
 
     try:
         start_time = time.time()
@@ -1053,6 +990,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    import time
-
     asyncio.run(main())
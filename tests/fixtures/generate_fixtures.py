@@ -4,24 +4,84 @@ Generate test video files for comprehensive testing.
 Requires: ffmpeg installed on system
 """
 
+import argparse
+import asyncio
+import contextlib
 import os
 import subprocess
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
+
+from tqdm import tqdm
+
+# Length of the shared audio tracks; longer fixtures encode their own audio
+SHARED_AUDIO_SECONDS = 60
+
+
+def _encode_timeout(duration: float) -> float:
+    """Seconds to allow an FFmpeg run producing ``duration`` seconds of media.
+
+    Generous enough for slow CI runners, while a wedged FFmpeg on a short
+    clip is still killed quickly.
+    """
+    return max(10, 4 * duration + 5)
+
+
+def _usable_cores() -> list[int]:
+    """CPU cores this process may run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+@dataclass(frozen=True)
+class FixtureJob:
+    """A single queued FFmpeg fixture encode."""
+
+    output_path: Path
+    params: dict[str, Any] = field(default_factory=dict)
+    success: str = ""
+    failure: str | None = None
+    kind: str = "video"  # "video", "audio" or "video_set"
 
 
 class TestVideoGenerator:
     """Generate various test videos for comprehensive testing."""
 
-    def __init__(self, output_dir: Path):
+    def __init__(
+        self, output_dir: Path, force: bool = False, masters_dir: Path | None = None
+    ):
         self.output_dir = Path(output_dir)
+        self.force = force  # Regenerate fixtures that already exist
         self.valid_dir = self.output_dir / "valid"
         self.corrupt_dir = self.output_dir / "corrupt"
         self.edge_cases_dir = self.output_dir / "edge_cases"
+        # Intermediate encodes are kept beside the fixture tree rather than in
+        # it, so nothing that walks the fixtures mistakes them for test videos
+        if masters_dir is None:
+            masters_dir = self.output_dir.parent / ".fixture-masters"
+        self.masters_dir = Path(masters_dir)
 
         # Create directories
         for dir_path in [self.valid_dir, self.corrupt_dir, self.edge_cases_dir]:
             dir_path.mkdir(parents=True, exist_ok=True)
 
+        # Encodes queued by the generate_* methods, run together by run_jobs
+        self._jobs: list[FixtureJob] = []
+
+        # Encodes shared by several fixtures (lossless video masters and
+        # AAC tracks), keyed by their file name in the masters cache
+        self._masters: dict[str, asyncio.Task] = {}
+
+        # Cores free for an FFmpeg process, set up by run_jobs; claims that
+        # need several cores take them under the lock so two partial claims
+        # cannot wait on each other
+        self._cores: asyncio.Queue[int] | None = None
+        self._cores_lock: asyncio.Lock | None = None
+        self._core_count = 0
+
     def generate_all(self):
         """Generate all test fixtures."""
         print("🎬 Generating test videos...")
@@ -41,6 +101,9 @@ class TestVideoGenerator:
             # Edge cases
             self.generate_edge_cases()
 
+            # Encode everything queued above
+            asyncio.run(self.run_jobs())
+
             # Corrupt videos
             self.generate_corrupt_videos()
 
@@ -51,6 +114,12 @@ class TestVideoGenerator:
             print(f"❌ Error generating fixtures: {e}")
             return False
 
+    def _is_cached(self, *paths: Path) -> bool:
+        """Whether every path already holds a fixture from an earlier run."""
+        return not self.force and all(
+            path.exists() and path.stat().st_size > 0 for path in paths
+        )
+
     def _check_ffmpeg(self) -> bool:
         """Check if FFmpeg is available."""
         try:
@@ -59,6 +128,43 @@ class TestVideoGenerator:
         except (subprocess.CalledProcessError, FileNotFoundError):
             return False
 
+    async def run_jobs(self):
+        """Run all queued encodes concurrently and report each result."""
+        # Encoders are single-threaded, so run one FFmpeg process per core;
+        # each process claims a core from this queue while it runs
+        self._cores = asyncio.Queue()
+        for core in _usable_cores():
+            self._cores.put_nowait(core)
+        self._core_count = self._cores.qsize()
+        self._cores_lock = asyncio.Lock()
+
+        async def run(index: int) -> tuple[int, bool]:
+            return index, await self._run_job(self._jobs[index])
+
+        # Jobs finish out of order, so show a progress bar while they run and
+        # report the results in queue order afterwards
+        results = [False] * len(self._jobs)
+        with tqdm(total=len(self._jobs), desc="  Encoding", unit="file") as pbar:
+            for finished in asyncio.as_completed(map(run, range(len(self._jobs)))):
+                index, results[index] = await finished
+                pbar.update()
+
+        for job, ok in zip(self._jobs, results, strict=True):
+            if ok:
+                print(job.success)
+            elif job.failure:
+                print(job.failure)
+        self._jobs.clear()
+
+    async def _run_job(self, job: FixtureJob) -> bool:
+        """Run a single queued encode."""
+        create = {
+            "video": self._create_video,
+            "audio": self._create_audio_only,
+            "video_set": self._create_video_set,
+        }[job.kind]
+        return await create(job.output_path, **job.params)
+
     def generate_standard_videos(self):
         """Generate standard test videos in common formats."""
         formats = {
@@ -86,11 +192,14 @@ class TestVideoGenerator:
         }
 
         for filename, params in formats.items():
-            output_path = self.valid_dir / filename
-            if self._create_video(output_path, **params):
-                print(f"  ✓ Generated: {filename}")
-            else:
-                print(f"  ⚠ Failed: {filename}")
+            self._jobs.append(
+                FixtureJob(
+                    self.valid_dir / filename,
+                    params,
+                    success=f"  ✓ Generated: {filename}",
+                    failure=f"  ⚠ Failed: {filename}",
+                )
+            )
 
     def generate_format_variants(self):
         """Generate videos in various container formats."""
@@ -102,17 +211,21 @@ class TestVideoGenerator:
             # Choose appropriate codec for format
             codec_map = {"mp4": "libx264", "webm": "libvpx", "ogv": "libtheora"}
 
-            if self._create_video(
-                output_path,
-                codec=codec_map.get(fmt, "libx264"),
-                duration=3,
-                resolution="640x480",
-                fps=24,
-                audio=True,
-            ):
-                print(f"  ✓ Format variant: {fmt}")
-            else:
-                print(f"  ⚠ Skipped {fmt}: codec not available")
+            self._jobs.append(
+                FixtureJob(
+                    output_path,
+                    {
+                        "codec": codec_map.get(fmt, "libx264"),
+                        "duration": 3,
+                        "resolution": "640x480",
+                        "fps": 24,
+                        "audio": True,
+                        "from_master": True,
+                    },
+                    success=f"  ✓ Format variant: {fmt}",
+                    failure=f"  ⚠ Skipped {fmt}: codec not available",
+                )
+            )
 
     def generate_resolution_variants(self):
         """Generate videos with various resolutions."""
@@ -126,17 +239,18 @@ class TestVideoGenerator:
             "tiny_resolution.mp4": "128x96",  # Very small
         }
 
-        for filename, resolution in resolutions.items():
-            output_path = self.valid_dir / filename
-            if self._create_video(
-                output_path,
-                codec="libx264",
-                duration=3,
-                resolution=resolution,
-                fps=30,
-                audio=True,
-            ):
-                print(f"  ✓ Resolution: {filename} ({resolution})")
+        # One FFmpeg run renders the source once and scales it to every size
+        self._jobs.append(
+            FixtureJob(
+                self.valid_dir,
+                {"resolutions": resolutions, "duration": 3, "fps": 30},
+                success="\n".join(
+                    f"  ✓ Resolution: {filename} ({resolution})"
+                    for filename, resolution in resolutions.items()
+                ),
+                kind="video_set",
+            )
+        )
 
     def generate_audio_variants(self):
         """Generate videos with various audio configurations."""
@@ -147,99 +261,119 @@ class TestVideoGenerator:
         }
 
         for filename, params in variants.items():
-            output_path = self.valid_dir / filename
-            if self._create_video(
-                output_path,
-                codec="libx264",
-                duration=3,
-                resolution="640x480",
-                fps=24,
-                **params,
-            ):
-                print(f"  ✓ Audio variant: {filename}")
+            self._jobs.append(
+                FixtureJob(
+                    self.valid_dir / filename,
+                    {
+                        "codec": "libx264",
+                        "duration": 3,
+                        "resolution": "640x480",
+                        "fps": 24,
+                        "from_master": True,
+                        **params,
+                    },
+                    success=f"  ✓ Audio variant: {filename}",
+                )
+            )
 
     def generate_edge_cases(self):
         """Generate edge case videos."""
 
         # Very short video (1 frame)
-        if self._create_video(
-            self.edge_cases_dir / "one_frame.mp4",
-            codec="libx264",
-            duration=0.033,  # ~1 frame at 30fps
-            resolution="640x480",
-            fps=30,
-            audio=False,
-        ):
-            print("  ✓ Edge case: one_frame.mp4")
+        self._jobs.append(
+            FixtureJob(
+                self.edge_cases_dir / "one_frame.mp4",
+                {
+                    "codec": "libx264",
+                    "duration": 0.033,  # ~1 frame at 30fps
+                    "resolution": "640x480",
+                    "fps": 30,
+                    "audio": False,
+                },
+                success="  ✓ Edge case: one_frame.mp4",
+            )
+        )
 
         # High FPS video
-        if self._create_video(
-            self.edge_cases_dir / "high_fps.mp4",
-            codec="libx264",
-            duration=2,
-            resolution="640x480",
-            fps=60,
-            extra_args="-preset ultrafast",
-        ):
-            print("  ✓ Edge case: high_fps.mp4")
+        self._jobs.append(
+            FixtureJob(
+                self.edge_cases_dir / "high_fps.mp4",
+                {
+                    "codec": "libx264",
+                    "duration": 2,
+                    "resolution": "640x480",
+                    "fps": 60,
+                    "extra_args": "-preset ultrafast",
+                },
+                success="  ✓ Edge case: high_fps.mp4",
+            )
+        )
 
         # Only audio, no video
-        if self._create_audio_only(self.edge_cases_dir / "audio_only.mp4", duration=3):
-            print("  ✓ Edge case: audio_only.mp4")
+        self._jobs.append(
+            FixtureJob(
+                self.edge_cases_dir / "audio_only.mp4",
+                {"duration": 3},
+                success="  ✓ Edge case: audio_only.mp4",
+                kind="audio",
+            )
+        )
 
         # Long duration but small file (low quality)
-        if self._create_video(
-            self.edge_cases_dir / "long_duration.mp4",
-            codec="libx264",
-            duration=60,  # 1 minute
-            resolution="320x240",
-            fps=15,
-            extra_args="-b:v 50k -preset ultrafast",  # Very low bitrate
-        ):
-            print("  ✓ Edge case: long_duration.mp4")
+        self._jobs.append(
+            FixtureJob(
+                self.edge_cases_dir / "long_duration.mp4",
+                {
+                    "codec": "libx264",
+                    "duration": 60,  # 1 minute
+                    "resolution": "320x240",
+                    "fps": 15,
+                    "extra_args": "-b:v 50k -preset ultrafast",  # Very low bitrate
+                },
+                success="  ✓ Edge case: long_duration.mp4",
+            )
+        )
 
     def generate_corrupt_videos(self):
         """Generate corrupted/broken video files for error testing."""
 
-        # Empty file
-        empty_file = self.corrupt_dir / "empty.mp4"
-        empty_file.touch()
-        print("  ✓ Corrupt: empty.mp4")
-
-        # Text file with video extension
-        text_as_video = self.corrupt_dir / "text_file.mp4"
-        with open(text_as_video, "w") as f:
-            f.write("This is not a video file!\n" * 100)
-        print("  ✓ Corrupt: text_file.mp4")
-
-        # Random bytes file with .mp4 extension
-        random_bytes = self.corrupt_dir / "random_bytes.mp4"
-        with open(random_bytes, "wb") as f:
-            f.write(os.urandom(1024 * 5))  # 5KB of random data
-        print("  ✓ Corrupt: random_bytes.mp4")
-
-        # Create and then truncate a video
-        truncated = self.corrupt_dir / "truncated.mp4"
-        if self._create_video(
-            truncated, codec="libx264", duration=5, resolution="640x480", fps=24
-        ):
-            # Truncate to 1KB
-            with open(truncated, "r+b") as f:
-                f.truncate(1024)
-            print("  ✓ Corrupt: truncated.mp4")
-
-        # Create a file with bad header
-        bad_header = self.corrupt_dir / "bad_header.mp4"
-        if self._create_video(
-            bad_header, codec="libx264", duration=3, resolution="640x480", fps=24
-        ):
-            # Corrupt the header
-            with open(bad_header, "r+b") as f:
-                f.seek(4)  # Skip 'ftyp' marker
-                f.write(b"XXXX")  # Corrupt the brand
-            print("  ✓ Corrupt: bad_header.mp4")
+        # The MP4s are built from boxes directly; only the start of the file
+        # matters to a demuxer, so there is nothing to gain from encoding a
+        # real video first
+        ftyp = (
+            (32).to_bytes(4, "big")
+            + b"ftyp"
+            + b"isom"  # Major brand
+            + (512).to_bytes(4, "big")  # Minor version
+            + b"isomiso2avc1mp41"  # Compatible brands
+        )
+
+        payloads = {
+            # Empty file
+            "empty.mp4": b"",
+            # Text file with video extension
+            "text_file.mp4": b"This is not a video file!\n" * 100,
+            # Random bytes file with .mp4 extension (5KB)
+            "random_bytes.mp4": os.urandom(1024 * 5),
+            # MP4 cut off at 1KB, partway through a media data box that
+            # claims to hold 1MB
+            "truncated.mp4": (
+                ftyp + (1 << 20).to_bytes(4, "big") + b"mdat" + os.urandom(1024)
+            )[:1024],
+            # MP4 whose first box type is garbage
+            "bad_header.mp4": (
+                ftyp.replace(b"ftyp", b"XXXX")
+                + (4096 + 8).to_bytes(4, "big")
+                + b"mdat"
+                + os.urandom(4096)
+            ),
+        }
+
+        for filename, data in payloads.items():
+            (self.corrupt_dir / filename).write_bytes(data)
+            print(f"  ✓ Corrupt: {filename}")
 
-    def _create_video(
+    async def _create_video(
         self,
         output_path: Path,
         codec: str,
@@ -250,23 +384,45 @@ class TestVideoGenerator:
         audio_channels: int = 2,
         audio_rate: int = 44100,
         extra_args: str = "",
+        from_master: bool = False,
     ) -> bool:
-        """Create a test video using FFmpeg."""
+        """Create a test video using FFmpeg.
+
+        With ``from_master`` the video is transcoded from a cached lossless
+        master instead of rendering the test source again. Audio is copied
+        from a shared AAC track rather than encoded for each video.
+        """
+        if self._is_cached(output_path):
+            return True
 
         width, height = map(int, resolution.split("x"))
 
+        master = None
+        if from_master:
+            master = await self._ensure_master(resolution, duration, fps)
+
+        audio_track = None
+        if audio and duration <= SHARED_AUDIO_SECONDS:
+            audio_track = await self._ensure_audio(audio_channels, audio_rate)
+
         # Build FFmpeg command
-        cmd = [
-            "ffmpeg",
-            "-y",  # Overwrite output files
-            "-f",
-            "lavfi",
-            "-i",
-            f"testsrc2=size={width}x{height}:rate={fps}:duration={duration}",
-        ]
+        cmd = ["ffmpeg", "-y"]  # Overwrite output files
+        if master:
+            cmd.extend(["-i", str(master)])
+        else:
+            cmd.extend(
+                [
+                    "-f",
+                    "lavfi",
+                    "-i",
+                    f"testsrc2=size={width}x{height}:rate={fps}:duration={duration}",
+                ]
+            )
 
         # Add audio input if needed
-        if audio:
+        if audio_track:
+            cmd.extend(["-i", str(audio_track)])
+        elif audio:
             cmd.extend(
                 [
                     "-f",
@@ -276,15 +432,25 @@ class TestVideoGenerator:
                 ]
             )
 
-        # Video encoding
-        cmd.extend(["-c:v", codec])
+        cmd.extend(["-map", "0:v"])
+        if audio:
+            cmd.extend(["-map", "1:a"])
+
+        # Video encoding; encodes already run one per core, so keep each
+        # encoder single-threaded rather than oversubscribing the CPU
+        cmd.extend(["-c:v", codec, "-threads", "1"])
+        if codec == "libx264" and "-preset" not in extra_args:
+            cmd.extend(["-preset", "ultrafast"])
 
         # Add extra arguments if provided
         if extra_args:
             cmd.extend(extra_args.split())
 
-        # Audio encoding or disable
-        if audio:
+        # Audio encoding or disable; the shared track is longer than the
+        # video, so it is cut to length with -shortest
+        if audio_track:
+            cmd.extend(["-c:a", "copy", "-shortest"])
+        elif audio:
             cmd.extend(
                 [
                     "-c:a",
@@ -304,47 +470,283 @@ class TestVideoGenerator:
         cmd.extend(["-pix_fmt", "yuv420p"])
 
         # Output file
-        cmd.append(str(output_path))
+        cmd.append(str(self._staging_path(output_path)))
 
         # Execute
-        try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                check=True,
-                timeout=30,  # 30 second timeout
-            )
+        return await self._run_ffmpeg(
+            cmd, timeout=_encode_timeout(duration), outputs=[output_path]
+        )
+
+    async def _create_video_set(
+        self,
+        output_dir: Path,
+        resolutions: dict[str, str],
+        duration: float,
+        fps: int,
+    ) -> bool:
+        """Create H.264 videos at several resolutions from one FFmpeg run.
+
+        The test source is rendered once at the largest size and scaled for
+        each output.
+        """
+        outputs = [output_dir / filename for filename in resolutions]
+        if self._is_cached(*outputs):
             return True
-        except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
+
+        audio_track = await self._ensure_audio(channels=2, rate=44100)
+        if not audio_track:
             return False
 
-    def _create_audio_only(self, output_path: Path, duration: float) -> bool:
-        """Create an audio-only file."""
+        largest = max(
+            resolutions.values(),
+            key=lambda res: int(res.split("x")[0]) * int(res.split("x")[1]),
+        )
         cmd = [
             "ffmpeg",
             "-y",
             "-f",
             "lavfi",
             "-i",
-            f"sine=frequency=440:duration={duration}",
-            "-c:a",
-            "aac",
-            "-b:a",
-            "128k",
-            str(output_path),
+            f"testsrc2=size={largest}:rate={fps}:duration={duration}",
+            "-i",
+            str(audio_track),
         ]
 
-        try:
-            subprocess.run(cmd, capture_output=True, check=True, timeout=15)
+        for filename, resolution in resolutions.items():
+            width, height = resolution.split("x")
+            cmd.extend(
+                [
+                    "-map",
+                    "0:v",
+                    "-map",
+                    "1:a",
+                    "-vf",
+                    f"scale={width}:{height}:flags=fast_bilinear,setsar=1",
+                    "-c:v",
+                    "libx264",
+                    "-threads",
+                    "1",
+                    "-preset",
+                    "ultrafast",
+                    "-c:a",
+                    "copy",
+                    "-shortest",
+                    "-pix_fmt",
+                    "yuv420p",
+                    str(self._staging_path(output_dir / filename)),
+                ]
+            )
+
+        # One single-threaded encoder per output, so claim a core for each
+        return await self._run_ffmpeg(
+            cmd,
+            timeout=_encode_timeout(duration) * len(resolutions),
+            outputs=outputs,
+            cores=len(resolutions),
+        )
+
+    async def _ensure_master(
+        self, resolution: str, duration: float, fps: int
+    ) -> Path | None:
+        """Return a lossless FFV1 master of the test source.
+
+        Returns None if the master could not be created.
+        """
+        return await self._ensure_cached(
+            f"master_{resolution}_{fps}_{duration}.mkv",
+            duration,
+            [
+                "-f",
+                "lavfi",
+                "-i",
+                f"testsrc2=size={resolution}:rate={fps}:duration={duration}",
+                "-c:v",
+                "ffv1",
+                "-threads",
+                "1",
+                "-f",
+                "matroska",
+            ],
+        )
+
+    async def _ensure_audio(self, channels: int, rate: int) -> Path | None:
+        """Return a shared AAC tone track lasting ``SHARED_AUDIO_SECONDS``.
+
+        Returns None if the track could not be created.
+        """
+        return await self._ensure_cached(
+            f"audio_{channels}ch_{rate}.m4a",
+            SHARED_AUDIO_SECONDS,
+            [
+                "-f",
+                "lavfi",
+                "-i",
+                f"sine=frequency=440:sample_rate={rate}"
+                f":duration={SHARED_AUDIO_SECONDS}",
+                "-c:a",
+                "aac",
+                "-ac",
+                str(channels),
+                "-b:a",
+                "128k",
+                "-f",
+                "mp4",
+            ],
+        )
+
+    async def _ensure_cached(
+        self, filename: str, duration: float, args: list[str]
+    ) -> Path | None:
+        """Return ``filename`` from the masters cache, encoding it once.
+
+        ``args`` are the FFmpeg input and encoding arguments for ``duration``
+        seconds of media; concurrent callers share a single encode.
+        """
+        if filename not in self._masters:
+            self._masters[filename] = asyncio.create_task(
+                self._encode_cached(filename, duration, args)
+            )
+        return await self._masters[filename]
+
+    async def _encode_cached(
+        self, filename: str, duration: float, args: list[str]
+    ) -> Path | None:
+        """Encode a file into the masters cache unless it is already there.
+
+        With ``force`` the file is encoded again, once per run.
+        """
+        master = self.masters_dir / filename
+        if master.exists() and not self.force:
+            return master
+
+        self.masters_dir.mkdir(parents=True, exist_ok=True)
+
+        cmd = ["ffmpeg", "-y", *args, str(self._staging_path(master))]
+        if not await self._run_ffmpeg(
+            cmd, timeout=_encode_timeout(duration), outputs=[master]
+        ):
+            return None
+        return master
+
+    async def _create_audio_only(self, output_path: Path, duration: float) -> bool:
+        """Create an audio-only file."""
+        if self._is_cached(output_path):
             return True
-        except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
+
+        audio_track = await self._ensure_audio(channels=1, rate=44100)
+        if not audio_track:
             return False
 
+        cmd = [
+            "ffmpeg",
+            "-y",
+            "-i",
+            str(audio_track),
+            "-t",
+            str(duration),
+            "-c:a",
+            "copy",
+            str(self._staging_path(output_path)),
+        ]
+
+        return await self._run_ffmpeg(
+            cmd, timeout=_encode_timeout(duration), outputs=[output_path]
+        )
+
+    async def _run_ffmpeg(
+        self,
+        cmd: list[str],
+        timeout: float,
+        outputs: Sequence[Path] = (),
+        cores: int = 1,
+    ) -> bool:
+        """Run an FFmpeg command, returning whether it succeeded in time.
+
+        ``cmd`` must write each of ``outputs`` to its staging path. They are
+        moved into place only if the command succeeds, so a failed or
+        interrupted run never leaves a partial file to be mistaken for a
+        cached fixture. ``cores`` is the number of single-threaded encoders
+        the command runs.
+        """
+        async with self._claim_cores(cores) as claimed:
+            # Only the exit status matters; discarding the output means there
+            # is no pipe for FFmpeg to block on, and no stdin for it to read
+            # keys from
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+            if claimed and hasattr(os, "sched_setaffinity"):
+                # Pinning keeps the encoders' caches warm instead of letting
+                # them migrate between cores
+                with contextlib.suppress(OSError):  # It may have exited already
+                    os.sched_setaffinity(proc.pid, claimed)
+
+            ok = False
+            try:
+                ok = await asyncio.wait_for(proc.wait(), timeout) == 0
+            except TimeoutError:
+                pass
+            finally:
+                # Timed out, cancelled or interrupted: don't leave FFmpeg
+                # running, or writing to a staging file removed below
+                if proc.returncode is None:
+                    with contextlib.suppress(ProcessLookupError):
+                        proc.kill()
+                    await proc.wait()
+                for path in outputs:
+                    if ok:
+                        os.replace(self._staging_path(path), path)
+                    else:
+                        self._staging_path(path).unlink(missing_ok=True)
+        return ok
+
+    @staticmethod
+    def _staging_path(path: Path) -> Path:
+        """Where FFmpeg writes ``path`` before it is moved into place.
+
+        The staging file sits next to ``path``, so the move is an atomic
+        rename, and keeps its extension for FFmpeg's format detection.
+        """
+        return path.with_name(f".{path.stem}.part{path.suffix}")
+
+    @contextlib.asynccontextmanager
+    async def _claim_cores(self, count: int = 1):
+        """Reserve ``count`` free cores for one FFmpeg process.
+
+        Yields the set of claimed cores, at most every usable core. Yields an
+        empty set, without limiting concurrency, when called outside
+        run_jobs.
+        """
+        if self._cores is None:
+            yield set()
+            return
+
+        claimed: set[int] = set()
+        try:
+            async with self._cores_lock:
+                while len(claimed) < min(count, self._core_count):
+                    claimed.add(await self._cores.get())
+            yield claimed
+        finally:
+            for core in claimed:
+                self._cores.put_nowait(core)
+
 
 def main():
     """Main function to generate all fixtures."""
+    parser = argparse.ArgumentParser(description="Generate test video fixtures")
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenerate fixtures even if they already exist",
+    )
+    args = parser.parse_args()
+
     fixtures_dir = Path(__file__).parent / "videos"
-    generator = TestVideoGenerator(fixtures_dir)
+    generator = TestVideoGenerator(fixtures_dir, force=args.force)
 
     print("🎬 Video Processor Test Fixture Generator")
     print("=========================================")
@@ -3,17 +3,107 @@ Generate synthetic test videos using ffmpeg for specific test scenarios.
 Creates specific test scenarios that are hard to find in real videos.
 """
 
+import functools
+import os
 import subprocess
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
 from pathlib import Path
 
+# Hardware H.264 encoders, in order of preference
+HARDWARE_H264_ENCODERS = ("h264_nvenc", "h264_qsv", "h264_videotoolbox", "h264_v4l2m2m")
+
+
+@functools.cache
+def _detect_hw_encoder() -> str:
+    """Return the first working hardware H.264 encoder, else ``libx264``.
+
+    An encoder can be built into FFmpeg without a device to run it on, so
+    each listed candidate is checked by encoding a single frame.
+    """
+    try:
+        listing = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-encoders"],
+            capture_output=True,
+            text=True,
+            timeout=10,
+        ).stdout
+    except (OSError, subprocess.TimeoutExpired):
+        return "libx264"
+
+    available = {
+        line.split()[1] for line in listing.splitlines() if len(line.split()) > 1
+    }
+    for encoder in HARDWARE_H264_ENCODERS:
+        if encoder not in available:
+            continue
+        try:
+            probe = subprocess.run(
+                [
+                    "ffmpeg",
+                    "-hide_banner",
+                    "-v",
+                    "error",
+                    "-f",
+                    "lavfi",
+                    "-i",
+                    "color=s=256x256:d=0.1",
+                    "-frames:v",
+                    "1",
+                    "-c:v",
+                    encoder,
+                    "-f",
+                    "null",
+                    "-",
+                ],
+                capture_output=True,
+                timeout=10,
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            continue
+        if probe.returncode == 0:
+            return encoder
+    return "libx264"
+
+
+@dataclass(frozen=True)
+class SyntheticJob:
+    """A queued synthetic video, generated by calling ``create``.
+
+    If the job fails, the jobs in ``fallback`` are run instead. A batch job
+    generates every video in ``fallback`` at once.
+    """
+
+    filename: str
+    create: Callable[[], object]
+    skip_reason: str = ""
+    fallback: tuple["SyntheticJob", ...] = ()
+
 
 class SyntheticVideoGenerator:
     """Generate synthetic test videos for specific test scenarios."""
 
-    def __init__(self, output_dir: Path):
+    def __init__(self, output_dir: Path, parallel_workers: int | None = None):
+        """
+        Initialize generator.
+
+        Args:
+            output_dir: Directory to save generated videos
+            parallel_workers: FFmpeg runs at once; defaults to one per core
+        """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+        # Videos queued by the generate_* methods, generated by run_jobs
+        self._jobs: list[SyntheticJob] = []
+
+        # FFmpeg runs at once, and the threads each may use without the runs
+        # oversubscribing the cores; fewer workers get more threads each
+        cores = os.cpu_count() or 1
+        self.parallel_workers = max(1, parallel_workers or cores)
+        self.ffmpeg_threads = max(1, cores // self.parallel_workers)
+
     def generate_all(self):
         """Generate all synthetic test videos."""
         print("🎥 Generating Synthetic Test Videos...")
@@ -36,15 +126,110 @@ class SyntheticVideoGenerator:
         # Encoding stress tests
         self.generate_stress_tests()
 
+        # Generate everything queued above in parallel
+        self.run_jobs()
+
         print("✅ Synthetic video generation complete!")
 
+    def run_jobs(self):
+        """Generate all queued videos in parallel, reporting each as it finishes."""
+        # Each job mostly waits on FFmpeg, so threads are enough to keep every
+        # core encoding; results are printed from this thread only, so lines
+        # never interleave
+        with ThreadPoolExecutor(max_workers=self.parallel_workers) as executor:
+            pending = {executor.submit(job.create): job for job in self._jobs}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    job = pending.pop(future)
+                    if future.exception() is None:
+                        for generated in job.fallback or (job,):
+                            print(f"  ✓ Generated: {generated.filename}")
+                    elif job.fallback:
+                        # Find out which of the batch's videos can be made
+                        for retry in job.fallback:
+                            pending[executor.submit(retry.create)] = retry
+                    elif job.skip_reason:
+                        print(f"  ⚠ Skipped: {job.filename} ({job.skip_reason})")
+                    else:
+                        print(f"  ⚠ Skipped: {job.filename}")
+        self._jobs.clear()
+
+    def _queue(
+        self,
+        filename: str,
+        cmd: list[str],
+        skip_reason: str = "",
+        hw_encode: bool = False,
+    ):
+        """Queue an FFmpeg command that generates ``filename``.
+
+        With ``hw_encode``, the H.264 video is encoded with a hardware encoder
+        when one is available, falling back to the command as given if the
+        hardware encode fails.
+        """
+        job = SyntheticJob(
+            filename, functools.partial(self._run_ffmpeg, cmd), skip_reason
+        )
+        encoder = _detect_hw_encoder() if hw_encode else "libx264"
+        if encoder != "libx264":
+            if "-c:v" in cmd:
+                hw_cmd = cmd.copy()
+                hw_cmd[cmd.index("-c:v") + 1] = encoder
+            else:
+                hw_cmd = [*cmd[:-1], "-c:v", encoder, cmd[-1]]
+            job = SyntheticJob(
+                filename,
+                functools.partial(self._run_ffmpeg, hw_cmd),
+                skip_reason,
+                fallback=(job,),
+            )
+        self._jobs.append(job)
+
+    def _queue_batch(
+        self,
+        input_args: list[str],
+        outputs: list[tuple[str, list[str]]],
+        skip_reason: str = "",
+    ):
+        """Queue several encodes of one input as a single FFmpeg run.
+
+        ``outputs`` pairs each file name with its output arguments. The input
+        is generated once and shared by all the encoders. If the run fails,
+        e.g. because one codec is unavailable, each output is retried on its
+        own so the rest are still generated.
+        """
+        cmd = ["ffmpeg", "-y", *input_args]
+        fallback = []
+        for filename, output_args in outputs:
+            # Thread options are per output, so cap every encoder in the run
+            cmd += ["-threads", str(self.ffmpeg_threads), *output_args]
+            single_cmd = ["ffmpeg", "-y", *input_args, *output_args]
+            fallback.append(
+                SyntheticJob(
+                    filename,
+                    functools.partial(self._run_ffmpeg, single_cmd),
+                    skip_reason,
+                )
+            )
+
+        self._jobs.append(
+            SyntheticJob(
+                "",
+                functools.partial(self._run_ffmpeg, cmd),
+                skip_reason,
+                fallback=tuple(fallback),
+            )
+        )
+
     def generate_edge_cases(self):
         """Generate edge case test videos."""
         edge_dir = self.output_dir / "edge_cases"
         edge_dir.mkdir(exist_ok=True)
 
         # Single frame video
-        self._run_ffmpeg(
+        self._queue(
+            "single_frame.mp4",
             [
                 "ffmpeg",
                 "-y",
@@ -55,12 +240,12 @@ class SyntheticVideoGenerator:
                 "-vframes",
                 "1",
                 str(edge_dir / "single_frame.mp4"),
-            ]
+            ],
         )
-        print("  ✓ Generated: single_frame.mp4")
 
         # Very long duration but static (low bitrate possible)
-        self._run_ffmpeg(
+        self._queue(
+            "long_static.mp4",
             [
                 "ffmpeg",
                 "-y",
@@ -73,12 +258,12 @@ class SyntheticVideoGenerator:
                 "-crf",
                 "51",  # Very high compression
                 str(edge_dir / "long_static.mp4"),
-            ]
+            ],
         )
-        print("  ✓ Generated: long_static.mp4")
 
         # Extremely high FPS
-        self._run_ffmpeg(
+        self._queue(
+            "high_fps_120.mp4",
             [
                 "ffmpeg",
                 "-y",
@@ -89,9 +274,9 @@ class SyntheticVideoGenerator:
                 "-r",
                 "120",
                 str(edge_dir / "high_fps_120.mp4"),
-            ]
+            ],
+            hw_encode=True,
         )
-        print("  ✓ Generated: high_fps_120.mp4")
 
         # Unusual resolutions
         resolutions = [
@@ -103,21 +288,20 @@ class SyntheticVideoGenerator:
         ]
 
         for resolution, filename in resolutions:
-            try:
-                self._run_ffmpeg(
-                    [
-                        "ffmpeg",
-                        "-y",
-                        "-f",
-                        "lavfi",
-                        "-i",
-                        f"testsrc2=s={resolution}:d=1",
-                        str(edge_dir / filename),
-                    ]
-                )
-                print(f"  ✓ Generated: {filename}")
-            except:
-                print(f"  ⚠ Skipped: {filename} (resolution not supported)")
+            self._queue(
+                filename,
+                [
+                    "ffmpeg",
+                    "-y",
+                    "-f",
+                    "lavfi",
+                    "-i",
+                    f"testsrc2=s={resolution}:d=1",
+                    str(edge_dir / filename),
+                ],
+                "resolution not supported",
+                hw_encode=True,
+            )
 
         # Extreme aspect ratios
         aspects = [
@@ -126,21 +310,20 @@ class SyntheticVideoGenerator:
         ]
 
         for spec, filename in aspects:
-            try:
-                self._run_ffmpeg(
-                    [
-                        "ffmpeg",
-                        "-y",
-                        "-f",
-                        "lavfi",
-                        "-i",
-                        f"testsrc2=s={spec}:d=2",
-                        str(edge_dir / filename),
-                    ]
-                )
-                print(f"  ✓ Generated: {filename}")
-            except:
-                print(f"  ⚠ Skipped: {filename} (aspect ratio not supported)")
+            self._queue(
+                filename,
+                [
+                    "ffmpeg",
+                    "-y",
+                    "-f",
+                    "lavfi",
+                    "-i",
+                    f"testsrc2=s={spec}:d=2",
+                    str(edge_dir / filename),
+                ],
+                "aspect ratio not supported",
+                hw_encode=True,
+            )
 
     def generate_codec_tests(self):
         """Generate videos with various codecs and encoding parameters."""
@@ -154,16 +337,12 @@ class SyntheticVideoGenerator:
             ("high", "5.1", "h264_high_5_1.mp4"),
         ]
 
-        for profile, level, filename in h264_tests:
-            try:
-                self._run_ffmpeg(
+        self._queue_batch(
+            ["-f", "lavfi", "-i", "testsrc2=s=1280x720:d=3"],
+            [
+                (
+                    filename,
                     [
-                        "ffmpeg",
-                        "-y",
-                        "-f",
-                        "lavfi",
-                        "-i",
-                        "testsrc2=s=1280x720:d=3",
                         "-c:v",
                         "libx264",
                         "-profile:v",
@@ -171,11 +350,12 @@ class SyntheticVideoGenerator:
                         "-level",
                         level,
                         str(codec_dir / filename),
-                    ]
+                    ],
                 )
-                print(f"  ✓ Generated: {filename}")
-            except:
-                print(f"  ⚠ Skipped: {filename} (profile not supported)")
+                for profile, level, filename in h264_tests
+            ],
+            "profile not supported",
+        )
 
         # Different codecs
         codec_tests = [
@@ -186,46 +366,32 @@ class SyntheticVideoGenerator:
             ("mpeg4", "mpeg4.mp4", []),
         ]
 
-        for codec, filename, extra_opts in codec_tests:
-            try:
-                cmd = [
-                    "ffmpeg",
-                    "-y",
-                    "-f",
-                    "lavfi",
-                    "-i",
-                    "testsrc2=s=1280x720:d=2",
-                    "-c:v",
-                    codec,
-                ]
-                cmd.extend(extra_opts)
-                cmd.append(str(codec_dir / filename))
-
-                self._run_ffmpeg(cmd)
-                print(f"  ✓ Generated: {filename}")
-            except:
-                print(f"  ⚠ Skipped: {filename} (codec not available)")
+        self._queue_batch(
+            ["-f", "lavfi", "-i", "testsrc2=s=1280x720:d=2"],
+            [
+                (filename, ["-c:v", codec, *extra_opts, str(codec_dir / filename)])
+                for codec, filename, extra_opts in codec_tests
+            ],
+            "codec not available",
+        )
 
         # Bit depth variations (if x265 available)
-        try:
-            self._run_ffmpeg(
-                [
-                    "ffmpeg",
-                    "-y",
-                    "-f",
-                    "lavfi",
-                    "-i",
-                    "testsrc2=s=1280x720:d=2",
-                    "-c:v",
-                    "libx265",
-                    "-pix_fmt",
-                    "yuv420p10le",
-                    str(codec_dir / "10bit.mp4"),
-                ]
-            )
-            print("  ✓ Generated: 10bit.mp4")
-        except:
-            print("  ⚠ Skipped: 10bit.mp4")
+        self._queue(
+            "10bit.mp4",
+            [
+                "ffmpeg",
+                "-y",
+                "-f",
+                "lavfi",
+                "-i",
+                "testsrc2=s=1280x720:d=2",
+                "-c:v",
+                "libx265",
+                "-pix_fmt",
+                "yuv420p10le",
+                str(codec_dir / "10bit.mp4"),
+            ],
+        )
 
     def generate_audio_tests(self):
         """Generate videos with various audio configurations."""
@@ -233,7 +399,8 @@ class SyntheticVideoGenerator:
         audio_dir.mkdir(exist_ok=True)
 
         # No audio stream
-        self._run_ffmpeg(
+        self._queue(
+            "no_audio.mp4",
             [
                 "ffmpeg",
                 "-y",
@@ -243,9 +410,9 @@ class SyntheticVideoGenerator:
                 "testsrc2=s=640x480:d=3",
                 "-an",
                 str(audio_dir / "no_audio.mp4"),
-            ]
+            ],
+            hw_encode=True,
         )
-        print("  ✓ Generated: no_audio.mp4")
 
         # Various audio configurations
         audio_configs = [
@@ -256,36 +423,35 @@ class SyntheticVideoGenerator:
         ]
 
         for channels, sample_rate, filename in audio_configs:
-            try:
-                self._run_ffmpeg(
-                    [
-                        "ffmpeg",
-                        "-y",
-                        "-f",
-                        "lavfi",
-                        "-i",
-                        "testsrc2=s=640x480:d=2",
-                        "-f",
-                        "lavfi",
-                        "-i",
-                        f"sine=frequency=440:sample_rate={sample_rate}:duration=2",
-                        "-c:v",
-                        "libx264",
-                        "-c:a",
-                        "aac",
-                        "-ac",
-                        str(channels),
-                        "-ar",
-                        str(sample_rate),
-                        str(audio_dir / filename),
-                    ]
-                )
-                print(f"  ✓ Generated: {filename}")
-            except:
-                print(f"  ⚠ Skipped: {filename}")
+            self._queue(
+                filename,
+                [
+                    "ffmpeg",
+                    "-y",
+                    "-f",
+                    "lavfi",
+                    "-i",
+                    "testsrc2=s=640x480:d=2",
+                    "-f",
+                    "lavfi",
+                    "-i",
+                    f"sine=frequency=440:sample_rate={sample_rate}:duration=2",
+                    "-c:v",
+                    "libx264",
+                    "-c:a",
+                    "aac",
+                    "-ac",
+                    str(channels),
+                    "-ar",
+                    str(sample_rate),
+                    str(audio_dir / filename),
+                ],
+                hw_encode=True,
+            )
 
         # Audio-only file (no video stream)
-        self._run_ffmpeg(
+        self._queue(
+            "audio_only.mp4",
             [
                 "ffmpeg",
                 "-y",
@@ -296,9 +462,8 @@ class SyntheticVideoGenerator:
                 "-c:a",
                 "aac",
                 str(audio_dir / "audio_only.mp4"),
-            ]
+            ],
         )
-        print("  ✓ Generated: audio_only.mp4")
 
     def generate_pattern_tests(self):
         """Generate videos with specific visual patterns."""
@@ -312,24 +477,22 @@ class SyntheticVideoGenerator:
         ]
 
         for pattern, filename in patterns:
-            try:
-                self._run_ffmpeg(
-                    [
-                        "ffmpeg",
-                        "-y",
-                        "-f",
-                        "lavfi",
-                        "-i",
-                        f"{pattern}=s=1280x720:d=3",
-                        str(pattern_dir / filename),
-                    ]
-                )
-                print(f"  ✓ Generated: {filename}")
-            except:
-                print(f"  ⚠ Skipped: {filename}")
+            self._queue(
+                filename,
+                [
+                    "ffmpeg",
+                    "-y",
+                    "-f",
+                    "lavfi",
+                    "-i",
+                    f"{pattern}=s=1280x720:d=3",
+                    str(pattern_dir / filename),
+                ],
+            )
 
         # Checkerboard pattern
-        self._run_ffmpeg(
+        self._queue(
+            "checkerboard.mp4",
             [
                 "ffmpeg",
                 "-y",
@@ -340,9 +503,8 @@ class SyntheticVideoGenerator:
                 "-vf",
                 "geq=lum='if(mod(floor(X/40)+floor(Y/40),2),255,0)'",
                 str(pattern_dir / "checkerboard.mp4"),
-            ]
+            ],
         )
-        print("  ✓ Generated: checkerboard.mp4")
 
     def generate_motion_tests(self):
         """Generate videos with specific motion patterns."""
@@ -350,7 +512,8 @@ class SyntheticVideoGenerator:
         motion_dir.mkdir(exist_ok=True)
 
         # Fast rotation motion
-        self._run_ffmpeg(
+        self._queue(
+            "fast_rotation.mp4",
             [
                 "ffmpeg",
                 "-y",
@@ -361,12 +524,12 @@ class SyntheticVideoGenerator:
                 "-vf",
                 "rotate=PI*t",
                 str(motion_dir / "fast_rotation.mp4"),
-            ]
+            ],
         )
-        print("  ✓ Generated: fast_rotation.mp4")
 
         # Slow rotation motion
-        self._run_ffmpeg(
+        self._queue(
+            "slow_rotation.mp4",
             [
                 "ffmpeg",
                 "-y",
@@ -377,12 +540,12 @@ class SyntheticVideoGenerator:
                 "-vf",
                 "rotate=PI*t/10",
                 str(motion_dir / "slow_rotation.mp4"),
-            ]
+            ],
         )
-        print("  ✓ Generated: slow_rotation.mp4")
 
         # Shake effect (simulated camera shake)
-        self._run_ffmpeg(
+        self._queue(
+            "camera_shake.mp4",
             [
                 "ffmpeg",
                 "-y",
@@ -393,16 +556,27 @@ class SyntheticVideoGenerator:
                 "-vf",
                 "crop=in_w-20:in_h-20:10*sin(t*10):10*cos(t*10)",
                 str(motion_dir / "camera_shake.mp4"),
-            ]
+            ],
         )
-        print("  ✓ Generated: camera_shake.mp4")
 
         # Scene changes
-        try:
-            self.create_scene_change_video(motion_dir / "scene_changes.mp4")
-            print("  ✓ Generated: scene_changes.mp4")
-        except:
-            print("  ⚠ Skipped: scene_changes.mp4 (concat not supported)")
+        scene_changes = motion_dir / "scene_changes.mp4"
+        job = SyntheticJob(
+            scene_changes.name,
+            functools.partial(self.create_scene_change_video, scene_changes),
+            "concat not supported",
+        )
+        encoder = _detect_hw_encoder()
+        if encoder != "libx264":
+            job = SyntheticJob(
+                scene_changes.name,
+                functools.partial(
+                    self.create_scene_change_video, scene_changes, encoder
+                ),
+                "concat not supported",
+                fallback=(job,),
+            )
+        self._jobs.append(job)
 
     def generate_stress_tests(self):
         """Generate videos that stress test the encoder."""
@@ -410,7 +584,8 @@ class SyntheticVideoGenerator:
         stress_dir.mkdir(exist_ok=True)
 
         # High complexity scene (mandelbrot fractal)
-        self._run_ffmpeg(
+        self._queue(
+            "high_complexity.mp4",
             [
                 "ffmpeg",
                 "-y",
@@ -421,12 +596,12 @@ class SyntheticVideoGenerator:
                 "-t",
                 "3",
                 str(stress_dir / "high_complexity.mp4"),
-            ]
+            ],
         )
-        print("  ✓ Generated: high_complexity.mp4")
 
         # Noise (hard to compress)
-        self._run_ffmpeg(
+        self._queue(
+            "noise_high.mp4",
             [
                 "ffmpeg",
                 "-y",
@@ -439,64 +614,77 @@ class SyntheticVideoGenerator:
                 "-t",
                 "3",
                 str(stress_dir / "noise_high.mp4"),
-            ]
+            ],
         )
-        print("  ✓ Generated: noise_high.mp4")
 
-    def create_scene_change_video(self, output_path: Path):
-        """Create a video with multiple scene changes."""
+    def create_scene_change_video(
+        self, output_path: Path, video_codec: str | None = None
+    ):
+        """Create a video with multiple scene changes.
+
+        ``video_codec`` overrides FFmpeg's default encoder for the container.
+        """
         colors = ["red", "green", "blue", "yellow", "magenta", "cyan", "white", "black"]
-        segments = []
 
-        for i, color in enumerate(colors):
-            segment_path = output_path.with_suffix(f".seg{i}.mp4")
-            self._run_ffmpeg(
-                [
-                    "ffmpeg",
-                    "-y",
-                    "-f",
-                    "lavfi",
-                    "-i",
-                    f"color=c={color}:s=640x480:d=0.5",
-                    str(segment_path),
-                ]
-            )
-            segments.append(str(segment_path))
+        # Join one color input per scene with the concat filter, in one process
+        cmd = ["ffmpeg", "-y"]
+        for color in colors:
+            cmd += ["-f", "lavfi", "-i", f"color=c={color}:s=640x480:d=0.5"]
+        inputs = "".join(f"[{i}:v]" for i in range(len(colors)))
+        cmd += [
+            "-filter_complex",
+            f"{inputs}concat=n={len(colors)}:v=1:a=0[out]",
+            "-map",
+            "[out]",
+        ]
+        if video_codec:
+            cmd += ["-c:v", video_codec]
+        cmd.append(str(output_path))
 
-        # Concatenate
-        with open(output_path.with_suffix(".txt"), "w") as f:
-            for seg in segments:
-                f.write(f"file '{seg}'\n")
+        self._run_ffmpeg(cmd)
 
-        self._run_ffmpeg(
-            [
-                "ffmpeg",
-                "-y",
-                "-f",
-                "concat",
-                "-safe",
-                "0",
-                "-i",
-                str(output_path.with_suffix(".txt")),
-                "-c",
-                "copy",
-                str(output_path),
+    def _run_ffmpeg(self, cmd: list[str]):
+        """Run FFmpeg command safely.
+
+        Raises CalledProcessError carrying the end of FFmpeg's stderr if the
+        command fails. Only that tail is kept, so memory stays bounded
+        however much FFmpeg logs.
+
+        Unless the command sets its own, the encoder and filter thread counts
+        are capped so parallel runs share the cores instead of each starting
+        a thread per core.
+        """
+        if "-threads" not in cmd:
+            threads = str(self.ffmpeg_threads)
+            last_input = len(cmd) - 1 - cmd[::-1].index("-i")
+            cmd = [
+                cmd[0],
+                "-filter_threads",
+                threads,
+                "-filter_complex_threads",
+                threads,
+                *cmd[1 : last_input + 2],
+                "-threads",
+                threads,
+                *cmd[last_input + 2 :],
             ]
-        )
-
-        # Cleanup
-        for seg in segments:
-            Path(seg).unlink()
-        output_path.with_suffix(".txt").unlink()
 
-    def _run_ffmpeg(self, cmd: list[str]):
-        """Run FFmpeg command safely."""
-        try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            return True
-        except subprocess.CalledProcessError as e:
-            # print(f"FFmpeg error: {e.stderr}")
-            raise e
+        stderr_tail = bytearray()
+        with subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL,  # Parallel runs must not read the terminal
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        ) as proc:
+            while chunk := proc.stderr.read(1 << 16):
+                stderr_tail += chunk
+                del stderr_tail[:-8192]
+
+        if proc.returncode:
+            raise subprocess.CalledProcessError(
+                proc.returncode, cmd, stderr=bytes(stderr_tail)
+            )
+        return True
 
 
 if __name__ == "__main__":
@@ -509,8 +697,17 @@ if __name__ == "__main__":
         default="tests/fixtures/videos/synthetic",
         help="Output directory",
     )
+    parser.add_argument(
+        "--workers",
+        "-j",
+        type=int,
+        default=None,
+        help="FFmpeg runs at once (default: one per core)",
+    )
 
     args = parser.parse_args()
 
-    generator = SyntheticVideoGenerator(Path(args.output))
+    generator = SyntheticVideoGenerator(
+        Path(args.output), parallel_workers=args.workers
+    )
     generator.generate_all()
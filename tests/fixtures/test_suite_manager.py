@@ -2,12 +2,19 @@
 Manage the complete test video suite.
 """
 
+import functools
 import hashlib
 import json
+import os
 import shutil
 import subprocess
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import fnmatchcase
 from pathlib import Path
 
+VIDEO_EXTENSIONS = {".mp4", ".webm", ".ogv", ".mkv", ".avi"}
+
 
 class TestSuiteManager:
     """Manage test video suite with categorization and validation."""
@@ -95,12 +102,15 @@ class TestSuiteManager:
         """Validate all test videos are accessible and valid."""
         print("\n🔍 Validating test suite...")
 
+        video_files = [Path(entry.path) for entry in self._iter_videos()]
+
+        # Each probe is a separate ffprobe process, so threads are enough
         invalid_files = []
         valid_count = 0
-
-        for ext in ["*.mp4", "*.webm", "*.ogv", "*.mkv", "*.avi"]:
-            for video_file in self.base_dir.rglob(ext):
-                if self.validate_video(video_file):
+        with ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 2) as executor:
+            results = executor.map(self.validate_video, video_files)
+            for video_file, valid in zip(video_files, results, strict=True):
+                if valid:
                     valid_count += 1
                 else:
                     invalid_files.append(video_file)
@@ -120,10 +130,10 @@ class TestSuiteManager:
             result = subprocess.run(
                 ["ffprobe", "-v", "error", str(video_path)],
                 capture_output=True,
-                timeout=5,
+                timeout=2,
             )
             return result.returncode == 0
-        except:
+        except (OSError, subprocess.TimeoutExpired):
             return False
 
     def generate_config(self):
@@ -135,38 +145,60 @@ class TestSuiteManager:
             "videos": {},
         }
 
-        # Expand suite patterns
+        # Catalog all videos, reusing hashes of files unchanged since last
+        # run. Modification times are local to a checkout, so they live in an
+        # untracked cache beside the videos rather than in the tracked config
+        config_path = self.base_dir / "test_suite.json"
+        cache_path = self.base_dir / ".test_suite.cache.json"
+        previous = self._load_hash_cache(cache_path)
+        # Reads and hashing release the GIL, so files are hashed concurrently.
+        # The walk order depends on the filesystem, so entries are sorted by
+        # path to keep the file identical across machines
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            entries = sorted(
+                executor.map(
+                    functools.partial(self._catalog_entry, previous=previous),
+                    self._iter_videos(),
+                )
+            )
+        config["videos"] = {rel_path: video for rel_path, video, _ in entries}
+        self._write_atomic(
+            cache_path,
+            json.dumps({rel_path: cached for rel_path, _, cached in entries}),
+        )
+
+        # Expand suite patterns against the catalog
+        video_parts = {rel_path: Path(rel_path).parts for rel_path in config["videos"]}
         for suite_name, patterns in self.suites.items():
             suite_files = []
             for pattern in patterns:
                 if "*" in pattern:
-                    # Glob pattern
-                    for f in self.base_dir.glob(pattern):
-                        if f.is_file():
-                            suite_files.append(str(f.relative_to(self.base_dir)))
-                else:
+                    # Glob pattern; match per component so "*" stays in one dir
+                    pattern_parts = Path(pattern).parts
+                    suite_files.extend(
+                        rel_path
+                        for rel_path, parts in video_parts.items()
+                        if len(parts) == len(pattern_parts)
+                        and all(map(fnmatchcase, parts, pattern_parts))
+                    )
+                elif pattern in video_parts:
                     # Specific file
-                    f = self.base_dir / pattern
-                    if f.exists():
-                        suite_files.append(pattern)
+                    suite_files.append(pattern)
 
             config["suites"][suite_name] = sorted(set(suite_files))
 
-        # Catalog all videos
-        for ext in ["*.mp4", "*.webm", "*.ogv", "*.mkv", "*.avi"]:
-            for video_file in self.base_dir.rglob(ext):
-                rel_path = str(video_file.relative_to(self.base_dir))
-                config["videos"][rel_path] = {
-                    "size_mb": video_file.stat().st_size / 1024 / 1024,
-                    "hash": self.get_file_hash(video_file),
-                }
-
-        # Save configuration
-        config_path = self.base_dir / "test_suite.json"
-        with open(config_path, "w") as f:
-            json.dump(config, f, indent=2)
+        # Save configuration, unless nothing changed since the last run
+        content = json.dumps(config, indent=2)
+        try:
+            unchanged = config_path.read_text() == content
+        except OSError:
+            unchanged = False
 
-        print(f"\n📋 Test configuration saved to: {config_path}")
+        if unchanged:
+            print(f"\n📋 Test configuration is up to date: {config_path}")
+        else:
+            self._write_atomic(config_path, content)
+            print(f"\n📋 Test configuration saved to: {config_path}")
 
         # Print summary
         print("\n📊 Test Suite Summary:")
@@ -177,12 +209,82 @@ class TestSuiteManager:
         total_size = sum(v["size_mb"] for v in config["videos"].values())
         print(f"  Total size: {total_size:.1f} MB")
 
+    def _catalog_entry(
+        self, entry: os.DirEntry, previous: dict
+    ) -> tuple[str, dict, dict]:
+        """Build the catalog and hash cache entries of a video.
+
+        Returns its relative path, its entry in the tracked catalog and its
+        entry in the local hash cache.
+        """
+        video_file = Path(entry.path)
+        rel_path = str(video_file.relative_to(self.base_dir))
+        stat = entry.stat()
+        mtime_size = [stat.st_mtime_ns, stat.st_size]
+        cached = previous.get(rel_path, {})
+        if cached.get("mtime_size") == mtime_size and "hash" in cached:
+            file_hash = cached["hash"]
+        else:
+            file_hash = self.get_file_hash(video_file)
+        return (
+            rel_path,
+            {"size_mb": stat.st_size / 1024 / 1024, "hash": file_hash},
+            {"mtime_size": mtime_size, "hash": file_hash},
+        )
+
+    def _load_hash_cache(self, cache_path: Path) -> dict:
+        """Load the local hash cache of an earlier run, if any."""
+        try:
+            with open(cache_path) as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return cache if isinstance(cache, dict) else {}
+
+    @staticmethod
+    def _write_atomic(path: Path, content: str):
+        """Write a file beside its target and rename it into place.
+
+        Readers never see a partially written file.
+        """
+        temp_path = path.with_name(f".{path.name}.tmp")
+        temp_path.write_text(content)
+        os.replace(temp_path, path)
+
+    def _iter_videos(self) -> Iterator[os.DirEntry]:
+        """Yield the video files under the base directory in a single walk.
+
+        Hidden entries (caches, partial downloads) are skipped, and symlinked
+        directories are not followed, so the walk cannot loop or leave the
+        tree.
+        """
+        pending = [self.base_dir]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        if entry.name.startswith("."):
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif (
+                            entry.is_file()
+                            and os.path.splitext(entry.name)[1].lower()
+                            in VIDEO_EXTENSIONS
+                        ):
+                            yield entry
+            except OSError:
+                continue
+
     def get_file_hash(self, file_path: Path) -> str:
-        """Get SHA256 hash of file (first 1MB for speed)."""
-        hasher = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            hasher.update(f.read(1024 * 1024))  # First 1MB
-        return hasher.hexdigest()[:16]  # Short hash
+        """Get a short BLAKE2b fingerprint of a file (first 1MB for speed).
+
+        The hash only identifies files in the catalog, so a fast 64-bit
+        digest is enough.
+        """
+        with open(file_path, "rb", buffering=0) as f:
+            head = f.read(1 << 20)  # First 1MB
+        return hashlib.blake2b(head, digest_size=8).hexdigest()
 
     def get_suite_videos(self, suite_name: str) -> list[Path]:
         """Get list of videos for a specific test suite."""
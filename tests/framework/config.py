@@ -1,8 +1,8 @@
 """Testing framework configuration management."""
 
 import os
+from functools import cache, cached_property
 from pathlib import Path
-from typing import Dict, List, Optional, Set
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -28,9 +28,13 @@ class ReportFormat(Enum):
     JUNIT = "junit"
 
 
-@dataclass
+@dataclass(frozen=True)
 class TestingConfig:
-    """Configuration for the video processor testing framework."""
+    """Configuration for the video processor testing framework.
+
+    The configuration is immutable, so derived values such as the pytest
+    arguments are computed once and instances can be used as cache keys.
+    """
 
     # Core settings
     project_name: str = "Video Processor"
@@ -43,17 +47,17 @@ class TestingConfig:
     fail_fast: bool = False
 
     # Test categories
-    enabled_categories: Set[TestCategory] = field(default_factory=lambda: {
+    enabled_categories: frozenset[TestCategory] = field(default_factory=lambda: frozenset({
         TestCategory.UNIT,
         TestCategory.INTEGRATION,
         TestCategory.SMOKE
-    })
+    }))
 
     # Report generation
-    report_formats: Set[ReportFormat] = field(default_factory=lambda: {
+    report_formats: frozenset[ReportFormat] = field(default_factory=lambda: frozenset({
         ReportFormat.HTML,
         ReportFormat.JSON
-    })
+    }))
 
     # Paths
     reports_dir: Path = field(default_factory=lambda: Path("test-reports"))
@@ -64,9 +68,9 @@ class TestingConfig:
     video_fixtures_dir: Path = field(default_factory=lambda: Path("tests/fixtures/videos"))
     ffmpeg_timeout: int = 60
     max_video_size_mb: int = 100
-    supported_codecs: Set[str] = field(default_factory=lambda: {
+    supported_codecs: frozenset[str] = field(default_factory=lambda: frozenset({
         "h264", "h265", "vp9", "av1"
-    })
+    }))
 
     # Quality thresholds
     min_test_coverage: float = 80.0
@@ -87,11 +91,7 @@ class TestingConfig:
     artifact_retention_days: int = 30
 
     def __post_init__(self):
-        """Ensure directories exist and validate configuration."""
-        self.reports_dir.mkdir(parents=True, exist_ok=True)
-        self.artifacts_dir.mkdir(parents=True, exist_ok=True)
-        self.temp_dir.mkdir(parents=True, exist_ok=True)
-
+        """Validate configuration."""
         # Validate thresholds
         if not 0 <= self.min_test_coverage <= 100:
             raise ValueError("min_test_coverage must be between 0 and 100")
@@ -99,6 +99,16 @@ class TestingConfig:
         if self.parallel_workers < 1:
             raise ValueError("parallel_workers must be at least 1")
 
+    def ensure_reports_dir(self) -> Path:
+        """Create the reports directory if needed and return it."""
+        self.reports_dir.mkdir(parents=True, exist_ok=True)
+        return self.reports_dir
+
+    def ensure_artifacts_dir(self) -> Path:
+        """Create the artifacts directory if needed and return it."""
+        self.artifacts_dir.mkdir(parents=True, exist_ok=True)
+        return self.artifacts_dir
+
     @classmethod
     def from_env(cls) -> "TestingConfig":
         """Create configuration from environment variables."""
@@ -111,8 +121,9 @@ class TestingConfig:
             min_test_coverage=float(os.getenv("MIN_COVERAGE", "80.0")),
         )
 
-    def get_pytest_args(self) -> List[str]:
-        """Generate pytest command line arguments from config."""
+    @cached_property
+    def pytest_args(self) -> tuple[str, ...]:
+        """Pytest command line arguments derived from the config."""
         args = [
             f"--maxfail={1 if self.fail_fast else 0}",
             f"--timeout={self.timeout_seconds}",
@@ -126,18 +137,29 @@ class TestingConfig:
         else:
             args.extend(["--tb=long", "-v"])
 
-        return args
+        return tuple(args)
 
-    def get_coverage_args(self) -> List[str]:
-        """Generate coverage arguments for pytest."""
-        return [
+    @cached_property
+    def coverage_args(self) -> tuple[str, ...]:
+        """Coverage arguments for pytest."""
+        return (
             "--cov=src/",
             f"--cov-fail-under={self.min_test_coverage}",
             "--cov-report=html",
             "--cov-report=term-missing",
             "--cov-report=json",
-        ]
+        )
+
+    def get_pytest_args(self) -> list[str]:
+        """Generate pytest command line arguments from config."""
+        return list(self.pytest_args)
+
+    def get_coverage_args(self) -> list[str]:
+        """Generate coverage arguments for pytest."""
+        return list(self.coverage_args)
 
 
-# Global configuration instance
-config = TestingConfig.from_env()
\ No newline at end of file
+@cache
+def get_config() -> TestingConfig:
+    """Get the configuration from the environment, created on first use."""
+    return TestingConfig.from_env()
@@ -1,7 +1,7 @@
 """Demo test showcasing the video processing testing framework capabilities."""
 
+import importlib.util
 import pytest
-import time
 from pathlib import Path
 
 
@@ -9,9 +9,11 @@ from pathlib import Path
 def test_framework_smoke_test(quality_tracker, video_test_config, video_assert):
     """Quick smoke test to verify framework functionality."""
     # Record some basic assertions for quality tracking
-    quality_tracker.record_assertion(True, "Framework initialization successful")
-    quality_tracker.record_assertion(True, "Configuration loaded correctly")
-    quality_tracker.record_assertion(True, "Quality tracker working")
+    quality_tracker.record_assertions([
+        (True, "Framework initialization successful"),
+        (True, "Configuration loaded correctly"),
+        (True, "Quality tracker working"),
+    ])
 
     # Test basic configuration
     assert video_test_config.project_name == "Video Processor"
@@ -52,9 +54,11 @@ def test_enhanced_fixtures(enhanced_temp_dir, video_config, test_video_scenarios
 def test_quality_metrics_tracking(quality_tracker):
     """Test quality metrics tracking functionality."""
     # Simulate some test activity
-    quality_tracker.record_assertion(True, "Basic functionality works")
-    quality_tracker.record_assertion(True, "Configuration is valid")
-    quality_tracker.record_assertion(False, "This is an expected failure for testing")
+    quality_tracker.record_assertions([
+        (True, "Basic functionality works"),
+        (True, "Configuration is valid"),
+        (False, "This is an expected failure for testing"),
+    ])
 
     # Record a warning
     quality_tracker.record_warning("This is a test warning")
@@ -71,12 +75,12 @@ def test_quality_metrics_tracking(quality_tracker):
 
 
 @pytest.mark.integration
-def test_mock_ffmpeg_environment(mock_ffmpeg_environment, quality_tracker):
+def test_mock_ffmpeg_environment(ffmpeg_mocks, quality_tracker):
     """Test the comprehensive FFmpeg mocking environment."""
-    # Test that mocks are available
-    assert "success" in mock_ffmpeg_environment
-    assert "failure" in mock_ffmpeg_environment
-    assert "probe" in mock_ffmpeg_environment
+    # Test that mocks are available; nothing runs FFmpeg, so nothing is patched
+    assert "success" in ffmpeg_mocks
+    assert "failure" in ffmpeg_mocks
+    assert "probe" in ffmpeg_mocks
 
     # Record this as a successful integration test
     quality_tracker.record_assertion(True, "FFmpeg environment mocked successfully")
@@ -89,16 +93,38 @@ def test_mock_ffmpeg_environment(mock_ffmpeg_environment, quality_tracker):
     print("✅ FFmpeg environment test completed")
 
 
+@pytest.mark.integration
+def test_mock_ffmpeg_environment_patching(mock_ffmpeg_environment, quality_tracker):
+    """Test that the FFmpeg mocks are patched into subprocess and ffmpeg."""
+    import json
+    import subprocess
+
+    import ffmpeg
+
+    # Calls go to the mocks, not the real binaries
+    assert subprocess.run is mock_ffmpeg_environment["run"]
+    assert ffmpeg.probe is mock_ffmpeg_environment["probe"]
+
+    # Encodes get the success result, probes the probe payload
+    result = subprocess.run(["ffmpeg", "-i", "input.mp4", "output.webm"])
+    assert result is mock_ffmpeg_environment["success"]
+    assert result.returncode == 0
+
+    result = subprocess.run(["ffprobe", "-show_streams", "input.mp4"])
+    assert json.loads(result.stdout)["streams"][0]["codec_name"] == "h264"
+    assert ffmpeg.probe("input.mp4")["streams"][0]["codec_name"] == "h264"
+    assert mock_ffmpeg_environment["run"].call_count == 2
+
+    quality_tracker.record_assertion(True, "FFmpeg mocks patched in")
+
+    print("✅ Patched FFmpeg environment test completed")
+
+
 @pytest.mark.performance
 def test_performance_benchmarking(performance_benchmarks, quality_tracker):
     """Test performance benchmarking functionality."""
-    # Simulate a performance test
-    start_time = time.time()
-
-    # Simulate some work
-    time.sleep(0.1)
-
-    duration = time.time() - start_time
+    # Simulate a performance test without spending real time on it
+    duration = 0.1  # Simulated encoding wall time
 
     # Check against benchmarks
     h264_720p_target = performance_benchmarks["encoding"]["h264_720p"]
@@ -160,8 +186,10 @@ def test_ai_analysis_fixtures(ai_analysis_fixtures, quality_tracker):
     assert object_tracking["max_objects_per_frame"] == 10
 
     # Record AI analysis metrics
-    quality_tracker.record_assertion(True, "AI analysis fixtures configured")
-    quality_tracker.record_assertion(True, "Scene detection parameters valid")
+    quality_tracker.record_assertions([
+        (True, "AI analysis fixtures configured"),
+        (True, "Scene detection parameters valid"),
+    ])
 
     print("✅ AI analysis fixtures test completed")
 
@@ -211,28 +239,33 @@ def test_comprehensive_framework_integration(
     assert test_artifact.exists()
 
     # Simulate comprehensive video processing workflow
-    quality_tracker.record_assertion(True, "Test environment setup")
-    quality_tracker.record_assertion(True, "Configuration validated")
-    quality_tracker.record_assertion(True, "Input video loaded")
+    quality_tracker.record_assertions([
+        (True, "Test environment setup"),
+        (True, "Configuration validated"),
+        (True, "Input video loaded"),
+    ])
 
     # Simulate multiple processing steps
-    for i in range(3):
-        quality_tracker.record_video_processing(
-            input_size_mb=40.0 + i * 10,
-            duration=1.0 + i * 0.5,
-            output_quality=8.0 + i * 0.2
-        )
+    quality_tracker.record_video_processings(
+        (40.0 + i * 10, 1.0 + i * 0.5, 8.0 + i * 0.2) for i in range(3)
+    )
 
     # Test custom assertions
     video_assert.assert_duration_preserved(10.0, 10.1, 0.2)  # Should pass
     video_assert.assert_file_size_reasonable(45.0, 100.0)  # Should pass
 
-    quality_tracker.record_assertion(True, "All processing steps completed")
-    quality_tracker.record_assertion(True, "Output validation successful")
+    quality_tracker.record_assertions([
+        (True, "All processing steps completed"),
+        (True, "Output validation successful"),
+    ])
 
     print("✅ Comprehensive framework integration test completed")
 
 
 if __name__ == "__main__":
-    # Allow running this test file directly for quick testing
-    pytest.main([__file__, "-v"])
\ No newline at end of file
+    # Allow running this test file directly for quick testing, spread across
+    # all cores when pytest-xdist is installed
+    args = [__file__, "-v"]
+    if importlib.util.find_spec("xdist"):
+        args.extend(["-n", "auto", "--dist=loadfile"])
+    pytest.main(args)
\ No newline at end of file
@@ -18,7 +18,7 @@ class EnhancedDashboardReporter:
     def __init__(self, config: TestingConfig):
         self.config = config
         self.test_results: List[TestResult] = []
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         self.summary_stats = {
             "total": 0,
             "passed": 0,
@@ -35,7 +35,7 @@ class EnhancedDashboardReporter:
 
     def generate_dashboard(self) -> str:
         """Generate the complete interactive dashboard HTML."""
-        duration = time.time() - self.start_time
+        duration = time.perf_counter() - self.start_time
         timestamp = datetime.now()
 
         return self._generate_dashboard_template(duration, timestamp)
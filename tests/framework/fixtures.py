@@ -1,22 +1,152 @@
 """Video processing specific test fixtures and utilities."""
 
 import asyncio
-import tempfile
+import json
 import shutil
 from pathlib import Path
-from typing import Dict, List, Optional, Generator, Any
-from unittest.mock import Mock, AsyncMock
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Generator, Any
+from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from video_processor import ProcessorConfig, VideoProcessor
 from .quality import QualityMetricsCalculator
 
 
+def _freeze(value: Any) -> Any:
+    """Recursively make fixture data read-only (mappings and tuples)."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+# Read-only fixture data, built once at import
+_TEST_VIDEO_SCENARIOS = _freeze({
+    "standard_hd": {
+        "name": "Standard HD Video",
+        "resolution": "1920x1080",
+        "duration": 10.0,
+        "codec": "h264",
+        "expected_outputs": ["mp4", "webm"],
+        "quality_threshold": 8.0
+    },
+    "short_clip": {
+        "name": "Short Video Clip",
+        "resolution": "1280x720",
+        "duration": 2.0,
+        "codec": "h264",
+        "expected_outputs": ["mp4"],
+        "quality_threshold": 7.5
+    },
+    "high_bitrate": {
+        "name": "High Bitrate Video",
+        "resolution": "3840x2160",
+        "duration": 5.0,
+        "codec": "h265",
+        "expected_outputs": ["mp4", "webm"],
+        "quality_threshold": 9.0
+    },
+    "edge_case_dimensions": {
+        "name": "Odd Dimensions",
+        "resolution": "1921x1081",
+        "duration": 3.0,
+        "codec": "h264",
+        "expected_outputs": ["mp4"],
+        "quality_threshold": 6.0
+    }
+})
+
+
+_PERFORMANCE_BENCHMARKS = _freeze({
+    "encoding": {
+        "h264_720p": 15.0,  # fps
+        "h264_1080p": 8.0,
+        "h265_720p": 6.0,
+        "h265_1080p": 3.0,
+        "webm_720p": 12.0,
+        "webm_1080p": 6.0
+    },
+    "thumbnails": {
+        "generation_time_720p": 0.5,  # seconds
+        "generation_time_1080p": 1.0,
+        "generation_time_4k": 2.0
+    },
+    "sprites": {
+        "creation_time_per_minute": 2.0,  # seconds
+        "max_sprite_size_mb": 5.0
+    }
+})
+
+
+_VIDEO_360 = _freeze({
+    "equirectangular": {
+        "projection": "equirectangular",
+        "fov": 360,
+        "resolution": "4096x2048",
+        "expected_processing_time": 30.0
+    },
+    "cubemap": {
+        "projection": "cubemap",
+        "face_size": 1024,
+        "expected_faces": 6,
+        "processing_complexity": "high"
+    },
+    "stereoscopic": {
+        "stereo_mode": "top_bottom",
+        "eye_separation": 65,  # mm
+        "depth_maps": True
+    }
+})
+
+
+_AI_ANALYSIS = _freeze({
+    "scene_detection": {
+        "min_scene_duration": 2.0,
+        "confidence_threshold": 0.8,
+        "expected_scenes": [
+            {"start": 0.0, "end": 5.0, "type": "indoor"},
+            {"start": 5.0, "end": 10.0, "type": "outdoor"}
+        ]
+    },
+    "object_tracking": {
+        "min_object_size": 50,  # pixels
+        "tracking_confidence": 0.7,
+        "max_objects_per_frame": 10
+    },
+    "quality_assessment": {
+        "sharpness_threshold": 0.6,
+        "noise_threshold": 0.3,
+        "compression_artifacts": 0.2
+    }
+})
+
+
+_STREAMING = _freeze({
+    "adaptive_streams": {
+        "resolutions": ["360p", "720p", "1080p"],
+        "bitrates": [800, 2500, 5000],  # kbps
+        "segment_duration": 4.0,  # seconds
+        "playlist_type": "vod"
+    },
+    "live_streaming": {
+        "latency_target": 3.0,  # seconds
+        "buffer_size": 6.0,  # seconds
+        "keyframe_interval": 2.0
+    }
+})
+
+
+def create_quality_tracker(request) -> QualityMetricsCalculator:
+    """Create a quality tracker for the requesting test."""
+    return QualityMetricsCalculator(request.node.name)
+
+
 @pytest.fixture
 def quality_tracker(request) -> QualityMetricsCalculator:
     """Fixture to track test quality metrics."""
-    test_name = request.node.name
-    tracker = QualityMetricsCalculator(test_name)
+    tracker = create_quality_tracker(request)
     yield tracker
 
     # Finalize and save metrics
@@ -26,27 +156,34 @@ def quality_tracker(request) -> QualityMetricsCalculator:
     request.node.quality_metrics = metrics
 
 
-@pytest.fixture
-def enhanced_temp_dir() -> Generator[Path, None, None]:
-    """Enhanced temporary directory with proper cleanup and structure."""
-    temp_path = Path(tempfile.mkdtemp(prefix="video_test_"))
+# Standard directory structure of an enhanced temporary directory
+ENHANCED_TEMP_SUBDIRS = ("input", "output", "thumbnails", "sprites", "logs")
+
+
+def create_enhanced_temp_dir(tmp_path_factory) -> Path:
+    """Create a fresh temporary directory with the standard structure.
 
-    # Create standard directory structure
-    (temp_path / "input").mkdir()
-    (temp_path / "output").mkdir()
-    (temp_path / "thumbnails").mkdir()
-    (temp_path / "sprites").mkdir()
-    (temp_path / "logs").mkdir()
+    The directory comes from pytest's ``tmp_path_factory``, so it is unique
+    per test even across pytest-xdist workers.
+    """
+    temp_path = tmp_path_factory.mktemp("video_test_")
+    for subdir in ENHANCED_TEMP_SUBDIRS:
+        (temp_path / subdir).mkdir()
+    return temp_path
 
+
+@pytest.fixture
+def enhanced_temp_dir(tmp_path_factory) -> Generator[Path, None, None]:
+    """Enhanced temporary directory with proper cleanup and structure."""
+    temp_path = create_enhanced_temp_dir(tmp_path_factory)
     yield temp_path
     shutil.rmtree(temp_path, ignore_errors=True)
 
 
-@pytest.fixture
-def video_config(enhanced_temp_dir: Path) -> ProcessorConfig:
-    """Enhanced video processor configuration for testing."""
+def create_video_config(base_path: Path) -> ProcessorConfig:
+    """Create the enhanced video processor configuration for testing."""
     return ProcessorConfig(
-        base_path=enhanced_temp_dir,
+        base_path=base_path,
         output_formats=["mp4", "webm"],
         quality_preset="medium",
         thumbnail_timestamp=1,
@@ -57,202 +194,166 @@ def video_config(enhanced_temp_dir: Path) -> ProcessorConfig:
 
 
 @pytest.fixture
-def enhanced_processor(video_config: ProcessorConfig) -> VideoProcessor:
-    """Enhanced video processor with test-specific configurations."""
-    processor = VideoProcessor(video_config)
+def video_config(enhanced_temp_dir: Path) -> ProcessorConfig:
+    """Enhanced video processor configuration for testing."""
+    return create_video_config(enhanced_temp_dir)
+
+
+def create_enhanced_processor(config: ProcessorConfig) -> VideoProcessor:
+    """Create a video processor with test-specific configurations."""
+    processor = VideoProcessor(config)
     # Add test-specific hooks or mocks here if needed
     return processor
 
 
 @pytest.fixture
-def mock_ffmpeg_environment(monkeypatch):
-    """Comprehensive FFmpeg mocking environment."""
-
-    def mock_run_success(*args, **kwargs):
-        return Mock(returncode=0, stdout=b"", stderr=b"frame=100 fps=30")
-
-    def mock_run_failure(*args, **kwargs):
-        return Mock(returncode=1, stdout=b"", stderr=b"Error: Invalid codec")
-
-    def mock_probe_success(*args, **kwargs):
-        return {
-            'streams': [
-                {
-                    'codec_name': 'h264',
-                    'width': 1920,
-                    'height': 1080,
-                    'duration': '10.0',
-                    'bit_rate': '5000000'
-                }
-            ]
-        }
-
-    # Default to success, can be overridden in specific tests
-    monkeypatch.setattr("subprocess.run", mock_run_success)
-    monkeypatch.setattr("ffmpeg.probe", mock_probe_success)
-
-    return {
-        "success": mock_run_success,
-        "failure": mock_run_failure,
-        "probe": mock_probe_success
+def enhanced_processor(video_config: ProcessorConfig) -> VideoProcessor:
+    """Enhanced video processor with test-specific configurations."""
+    return create_enhanced_processor(video_config)
+
+
+def create_ffmpeg_mocks() -> Dict[str, MagicMock]:
+    """Build preconfigured FFmpeg result mocks.
+
+    ``success`` and ``failure`` carry ``returncode``, ``stdout`` and
+    ``stderr`` and return themselves when called, so they can stand in for
+    either ``subprocess.run`` or its result. ``probe`` returns a probe payload
+    when called, like ``ffmpeg.probe``, and carries it as JSON ``stdout``
+    for ffprobe runs.
+    """
+    mocks = {"success": MagicMock(), "failure": MagicMock(), "probe": MagicMock()}
+    configure_ffmpeg_mocks(mocks)
+    return mocks
+
+
+def configure_ffmpeg_mocks(mocks: Dict[str, MagicMock]):
+    """Give the FFmpeg mocks their default results."""
+    success = mocks["success"]
+    success.configure_mock(returncode=0, stdout=b"", stderr=b"frame=100 fps=30")
+    success.return_value = success
+    failure = mocks["failure"]
+    failure.configure_mock(returncode=1, stdout=b"", stderr=b"Error: Invalid codec")
+    failure.return_value = failure
+    payload = {
+        'streams': [
+            {
+                'codec_name': 'h264',
+                'width': 1920,
+                'height': 1080,
+                'duration': '10.0',
+                'bit_rate': '5000000'
+            }
+        ]
     }
+    probe = mocks["probe"]
+    probe.configure_mock(returncode=0, stdout=json.dumps(payload).encode(), stderr=b"")
+    probe.return_value = payload
+
+
+@pytest.fixture(scope="session")
+def ffmpeg_mocks() -> Dict[str, MagicMock]:
+    """Preconfigured FFmpeg result mocks, without patching anything.
+
+    Request ``mock_ffmpeg_environment`` in tests that actually run FFmpeg.
+    """
+    return create_ffmpeg_mocks()
+
+
+def patch_ffmpeg_environment(mocks: Dict[str, MagicMock], monkeypatch) -> Dict[str, MagicMock]:
+    """Patch the shared FFmpeg mocks into ``subprocess`` and ``ffmpeg``.
+
+    ``subprocess.run`` becomes the returned ``run`` mock, which routes
+    encodes (commands with an ``-i`` input) to ``success`` and anything else,
+    such as ffprobe, to ``probe``. The mocks are shared across the session,
+    so calls, return values and side effects left by earlier tests are reset
+    to the defaults first.
+    """
+    for mock in mocks.values():
+        mock.reset_mock(return_value=True, side_effect=True)
+    configure_ffmpeg_mocks(mocks)
+
+    def route(args, *_, **__):
+        return mocks["success"] if "-i" in args else mocks["probe"]
+
+    # Default routing, can be overridden in specific tests
+    run = MagicMock(side_effect=route)
+    monkeypatch.setattr("subprocess.run", run)
+    monkeypatch.setattr("ffmpeg.probe", mocks["probe"])
+    return {**mocks, "run": run}
 
 
 @pytest.fixture
-def test_video_scenarios() -> Dict[str, Dict[str, Any]]:
+def mock_ffmpeg_environment(ffmpeg_mocks, monkeypatch) -> Dict[str, MagicMock]:
+    """Comprehensive FFmpeg mocking environment.
+
+    Patches ``subprocess.run`` and ``ffmpeg.probe`` for the test; request
+    ``ffmpeg_mocks`` instead when only the mock objects are needed.
+    """
+    return patch_ffmpeg_environment(ffmpeg_mocks, monkeypatch)
+
+
+@pytest.fixture(scope="session")
+def test_video_scenarios() -> Mapping[str, Mapping[str, Any]]:
     """Predefined test video scenarios for comprehensive testing."""
-    return {
-        "standard_hd": {
-            "name": "Standard HD Video",
-            "resolution": "1920x1080",
-            "duration": 10.0,
-            "codec": "h264",
-            "expected_outputs": ["mp4", "webm"],
-            "quality_threshold": 8.0
-        },
-        "short_clip": {
-            "name": "Short Video Clip",
-            "resolution": "1280x720",
-            "duration": 2.0,
-            "codec": "h264",
-            "expected_outputs": ["mp4"],
-            "quality_threshold": 7.5
-        },
-        "high_bitrate": {
-            "name": "High Bitrate Video",
-            "resolution": "3840x2160",
-            "duration": 5.0,
-            "codec": "h265",
-            "expected_outputs": ["mp4", "webm"],
-            "quality_threshold": 9.0
-        },
-        "edge_case_dimensions": {
-            "name": "Odd Dimensions",
-            "resolution": "1921x1081",
-            "duration": 3.0,
-            "codec": "h264",
-            "expected_outputs": ["mp4"],
-            "quality_threshold": 6.0
-        }
-    }
+    return _TEST_VIDEO_SCENARIOS
 
 
-@pytest.fixture
-def performance_benchmarks() -> Dict[str, Dict[str, float]]:
+@pytest.fixture(scope="session")
+def performance_benchmarks() -> Mapping[str, Mapping[str, float]]:
     """Performance benchmarks for different video processing operations."""
-    return {
-        "encoding": {
-            "h264_720p": 15.0,  # fps
-            "h264_1080p": 8.0,
-            "h265_720p": 6.0,
-            "h265_1080p": 3.0,
-            "webm_720p": 12.0,
-            "webm_1080p": 6.0
-        },
-        "thumbnails": {
-            "generation_time_720p": 0.5,  # seconds
-            "generation_time_1080p": 1.0,
-            "generation_time_4k": 2.0
-        },
-        "sprites": {
-            "creation_time_per_minute": 2.0,  # seconds
-            "max_sprite_size_mb": 5.0
-        }
-    }
+    return _PERFORMANCE_BENCHMARKS
 
 
-@pytest.fixture
-def video_360_fixtures() -> Dict[str, Any]:
+@pytest.fixture(scope="session")
+def video_360_fixtures() -> Mapping[str, Any]:
     """Specialized fixtures for 360° video testing."""
-    return {
-        "equirectangular": {
-            "projection": "equirectangular",
-            "fov": 360,
-            "resolution": "4096x2048",
-            "expected_processing_time": 30.0
-        },
-        "cubemap": {
-            "projection": "cubemap",
-            "face_size": 1024,
-            "expected_faces": 6,
-            "processing_complexity": "high"
-        },
-        "stereoscopic": {
-            "stereo_mode": "top_bottom",
-            "eye_separation": 65,  # mm
-            "depth_maps": True
-        }
-    }
+    return _VIDEO_360
 
 
-@pytest.fixture
-def ai_analysis_fixtures() -> Dict[str, Any]:
+@pytest.fixture(scope="session")
+def ai_analysis_fixtures() -> Mapping[str, Any]:
     """Fixtures for AI-powered video analysis testing."""
-    return {
-        "scene_detection": {
-            "min_scene_duration": 2.0,
-            "confidence_threshold": 0.8,
-            "expected_scenes": [
-                {"start": 0.0, "end": 5.0, "type": "indoor"},
-                {"start": 5.0, "end": 10.0, "type": "outdoor"}
-            ]
-        },
-        "object_tracking": {
-            "min_object_size": 50,  # pixels
-            "tracking_confidence": 0.7,
-            "max_objects_per_frame": 10
-        },
-        "quality_assessment": {
-            "sharpness_threshold": 0.6,
-            "noise_threshold": 0.3,
-            "compression_artifacts": 0.2
-        }
-    }
+    return _AI_ANALYSIS
 
 
-@pytest.fixture
-def streaming_fixtures() -> Dict[str, Any]:
+@pytest.fixture(scope="session")
+def streaming_fixtures() -> Mapping[str, Any]:
     """Fixtures for streaming and adaptive bitrate testing."""
+    return _STREAMING
+
+
+def create_async_test_environment() -> Dict[str, Any]:
+    """Create the async test environment; call from a running event loop."""
     return {
-        "adaptive_streams": {
-            "resolutions": ["360p", "720p", "1080p"],
-            "bitrates": [800, 2500, 5000],  # kbps
-            "segment_duration": 4.0,  # seconds
-            "playlist_type": "vod"
-        },
-        "live_streaming": {
-            "latency_target": 3.0,  # seconds
-            "buffer_size": 6.0,  # seconds
-            "keyframe_interval": 2.0
-        }
+        "loop": asyncio.get_running_loop(),
+        "tasks": [],
+        "semaphore": asyncio.Semaphore(4)  # Limit concurrent operations
     }
 
 
+async def cleanup_async_test_environment(environment: Dict[str, Any]):
+    """Cancel and await any tasks left in an async test environment."""
+    for task in environment["tasks"]:
+        if not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+
 @pytest.fixture
 async def async_test_environment():
     """Async environment setup for testing async video processing."""
-    # Setup async environment
-    tasks = []
+    environment = create_async_test_environment()
     try:
-        yield {
-            "loop": asyncio.get_event_loop(),
-            "tasks": tasks,
-            "semaphore": asyncio.Semaphore(4)  # Limit concurrent operations
-        }
+        yield environment
     finally:
-        # Cleanup any remaining tasks
-        for task in tasks:
-            if not task.done():
-                task.cancel()
-                try:
-                    await task
-                except asyncio.CancelledError:
-                    pass
+        await cleanup_async_test_environment(environment)
 
 
-@pytest.fixture
-def mock_procrastinate_advanced():
-    """Advanced Procrastinate mocking with realistic behavior."""
+def create_mock_procrastinate_app():
+    """Create an advanced Procrastinate app mock with realistic behavior."""
 
     class MockJob:
         def __init__(self, job_id: str, status: str = "todo"):
@@ -285,72 +386,94 @@ def mock_procrastinate_advanced():
     return MockApp()
 
 
+@pytest.fixture
+def mock_procrastinate_advanced():
+    """Advanced Procrastinate mocking with realistic behavior."""
+    return create_mock_procrastinate_app()
+
+
 # For backward compatibility, create a class that holds these fixtures
 class VideoTestFixtures:
     """Legacy class for accessing fixtures."""
 
     @staticmethod
-    def enhanced_temp_dir():
-        return enhanced_temp_dir()
+    def enhanced_temp_dir(tmp_path_factory):
+        return create_enhanced_temp_dir(tmp_path_factory)
 
     @staticmethod
     def video_config(enhanced_temp_dir):
-        return video_config(enhanced_temp_dir)
+        return create_video_config(enhanced_temp_dir)
 
     @staticmethod
     def enhanced_processor(video_config):
-        return enhanced_processor(video_config)
+        return create_enhanced_processor(video_config)
+
+    @staticmethod
+    def ffmpeg_mocks():
+        return create_ffmpeg_mocks()
 
     @staticmethod
-    def mock_ffmpeg_environment(monkeypatch):
-        return mock_ffmpeg_environment(monkeypatch)
+    def mock_ffmpeg_environment(ffmpeg_mocks, monkeypatch):
+        return patch_ffmpeg_environment(ffmpeg_mocks, monkeypatch)
 
     @staticmethod
     def test_video_scenarios():
-        return test_video_scenarios()
+        return _TEST_VIDEO_SCENARIOS
 
     @staticmethod
     def performance_benchmarks():
-        return performance_benchmarks()
+        return _PERFORMANCE_BENCHMARKS
 
     @staticmethod
     def video_360_fixtures():
-        return video_360_fixtures()
+        return _VIDEO_360
 
     @staticmethod
     def ai_analysis_fixtures():
-        return ai_analysis_fixtures()
+        return _AI_ANALYSIS
 
     @staticmethod
     def streaming_fixtures():
-        return streaming_fixtures()
+        return _STREAMING
 
     @staticmethod
     def async_test_environment():
-        return async_test_environment()
+        return create_async_test_environment()
 
     @staticmethod
     def mock_procrastinate_advanced():
-        return mock_procrastinate_advanced()
+        return create_mock_procrastinate_app()
 
     @staticmethod
     def quality_tracker(request):
-        return quality_tracker(request)
+        return create_quality_tracker(request)
 
 
 # Export commonly used fixtures for easy import
 __all__ = [
     "VideoTestFixtures",
+    "ENHANCED_TEMP_SUBDIRS",
+    "create_enhanced_temp_dir",
     "enhanced_temp_dir",
+    "create_video_config",
     "video_config",
+    "create_enhanced_processor",
     "enhanced_processor",
+    "create_ffmpeg_mocks",
+    "configure_ffmpeg_mocks",
+    "ffmpeg_mocks",
+    "patch_ffmpeg_environment",
     "mock_ffmpeg_environment",
     "test_video_scenarios",
     "performance_benchmarks",
     "video_360_fixtures",
     "ai_analysis_fixtures",
     "streaming_fixtures",
+    "create_async_test_environment",
+    "cleanup_async_test_environment",
     "async_test_environment",
+    "create_mock_procrastinate_app",
     "mock_procrastinate_advanced",
+    "create_quality_tracker",
     "quality_tracker"
 ]
\ No newline at end of file
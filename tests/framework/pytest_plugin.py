@@ -5,8 +5,8 @@ import time
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
-from .config import TestingConfig, TestCategory
-from .quality import QualityMetricsCalculator, TestHistoryDatabase
+from .config import TestCategory, get_config
+from .quality import QualityMetricsCalculator, TestHistoryDatabase, TestQualityMetrics
 from .reporters import HTMLReporter, JSONReporter, ConsoleReporter, TestResult
 
 
@@ -14,7 +14,7 @@ class VideoProcessorTestPlugin:
     """Main pytest plugin for video processor testing framework."""
 
     def __init__(self):
-        self.config = TestingConfig.from_env()
+        self.config = get_config()
         self.html_reporter = HTMLReporter(self.config)
         self.json_reporter = JSONReporter(self.config)
         self.console_reporter = ConsoleReporter(self.config)
@@ -23,6 +23,8 @@ class VideoProcessorTestPlugin:
         # Test session tracking
         self.session_start_time = 0
         self.test_metrics: Dict[str, QualityMetricsCalculator] = {}
+        # Finalized metrics of every test in the session, in completion order
+        self.quality_store: List[TestQualityMetrics] = []
 
     def pytest_configure(self, config):
         """Configure pytest with custom markers and settings."""
@@ -44,14 +46,25 @@ class VideoProcessorTestPlugin:
 
     def pytest_sessionstart(self, session):
         """Called at the start of test session."""
-        self.session_start_time = time.time()
+        self.session_start_time = time.perf_counter()
         print(f"\n🎬 Starting Video Processor Test Suite")
         print(f"Configuration: {self.config.parallel_workers} parallel workers")
         print(f"Reports will be saved to: {self.config.reports_dir}")
 
     def pytest_sessionfinish(self, session, exitstatus):
         """Called at the end of test session."""
-        session_duration = time.time() - self.session_start_time
+        # Record the session's metrics in the history database in one pass;
+        # under pytest-xdist each worker records the tests it ran
+        if self.config.enable_test_history:
+            for quality_metrics in self.quality_store:
+                self.quality_db.save_metrics(quality_metrics)
+
+        # Under pytest-xdist, workers forward their results to the controller,
+        # which writes the reports once for the whole run
+        if hasattr(session.config, "workerinput"):
+            return
+
+        session_duration = time.perf_counter() - self.session_start_time
 
         # Generate reports
         html_path = self.html_reporter.save_report()
@@ -93,9 +106,8 @@ class VideoProcessorTestPlugin:
             # Finalize quality metrics
             quality_metrics = self.test_metrics[test_name].finalize()
 
-            # Save to database if enabled
-            if self.config.enable_test_history:
-                self.quality_db.save_metrics(quality_metrics)
+            # Collect for the history database, written at session end
+            self.quality_store.append(quality_metrics)
 
             # Store in test item for reporting
             item.quality_metrics = quality_metrics
@@ -198,12 +210,18 @@ def quality_tracker(request):
     return getattr(request.node, 'quality_tracker', None)
 
 
+@pytest.fixture(scope="session")
+def quality_tracker_store(request) -> List[TestQualityMetrics]:
+    """Fixture exposing the finalized quality metrics of the session so far."""
+    return request.config._video_processor_plugin.quality_store
+
+
 @pytest.fixture
 def test_artifacts_dir(request):
     """Fixture providing test-specific artifacts directory."""
-    config = TestingConfig.from_env()
+    config = get_config()
     test_name = request.node.name.replace("::", "_").replace("/", "_")
-    artifacts_dir = config.artifacts_dir / test_name
+    artifacts_dir = config.ensure_artifacts_dir() / test_name
     artifacts_dir.mkdir(parents=True, exist_ok=True)
     return artifacts_dir
 
@@ -211,7 +229,7 @@ def test_artifacts_dir(request):
 @pytest.fixture
 def video_test_config():
     """Fixture providing video test configuration."""
-    return TestingConfig.from_env()
+    return get_config()
 
 
 # Pytest collection hooks for smart test discovery
@@ -300,6 +318,7 @@ def pytest_configure(config):
 __all__ = [
     "VideoProcessorTestPlugin",
     "quality_tracker",
+    "quality_tracker_store",
     "test_artifacts_dir",
     "video_test_config",
     "video_assert",
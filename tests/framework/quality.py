@@ -2,7 +2,7 @@
 
 import time
 import psutil
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, Iterable, List, Any, Optional, Tuple
 from dataclasses import dataclass, field
 from pathlib import Path
 import json
@@ -95,7 +95,7 @@ class QualityMetricsCalculator:
 
     def __init__(self, test_name: str):
         self.test_name = test_name
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         self.start_memory = psutil.virtual_memory().used / 1024 / 1024
         self.process = psutil.Process()
 
@@ -115,6 +115,11 @@ class QualityMetricsCalculator:
         else:
             self.errors.append(f"Assertion failed: {message}")
 
+    def record_assertions(self, results: Iterable[Tuple[bool, str]]):
+        """Record several ``(passed, message)`` assertion results at once."""
+        for passed, message in results:
+            self.record_assertion(passed, message)
+
     def record_error(self, error: str):
         """Record an error occurrence."""
         self.errors.append(error)
@@ -134,6 +139,11 @@ class QualityMetricsCalculator:
             "output_quality": output_quality
         })
 
+    def record_video_processings(self, runs: Iterable[Tuple[float, float, float]]):
+        """Record several ``(input_size_mb, duration, output_quality)`` runs."""
+        for input_size_mb, duration, output_quality in runs:
+            self.record_video_processing(input_size_mb, duration, output_quality)
+
     def calculate_functional_score(self) -> float:
         """Calculate functional quality score (0-10)."""
         if self.assertions_total == 0:
@@ -157,7 +167,7 @@ class QualityMetricsCalculator:
 
     def calculate_performance_score(self) -> float:
         """Calculate performance quality score (0-10)."""
-        duration = time.time() - self.start_time
+        duration = time.perf_counter() - self.start_time
         current_memory = psutil.virtual_memory().used / 1024 / 1024
         memory_usage = current_memory - self.start_memory
 
@@ -221,7 +231,7 @@ class QualityMetricsCalculator:
 
     def finalize(self) -> TestQualityMetrics:
         """Calculate final quality metrics."""
-        duration = time.time() - self.start_time
+        duration = time.perf_counter() - self.start_time
         current_memory = psutil.virtual_memory().used / 1024 / 1024
         memory_usage = max(0, current_memory - self.start_memory)
 
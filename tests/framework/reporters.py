@@ -34,7 +34,7 @@ class HTMLReporter:
     def __init__(self, config: TestingConfig):
         self.config = config
         self.test_results: List[TestResult] = []
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         self.summary_stats = {
             "total": 0,
             "passed": 0,
@@ -51,7 +51,7 @@ class HTMLReporter:
 
     def generate_report(self) -> str:
         """Generate the complete HTML report."""
-        duration = time.time() - self.start_time
+        duration = time.perf_counter() - self.start_time
         timestamp = datetime.now()
 
         html_content = self._generate_html_template(duration, timestamp)
@@ -1428,7 +1428,7 @@ class JSONReporter:
     def __init__(self, config: TestingConfig):
         self.config = config
         self.test_results: List[TestResult] = []
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
 
     def add_test_result(self, result: TestResult):
         """Add a test result."""
@@ -1436,7 +1436,7 @@ class JSONReporter:
 
     def generate_report(self) -> Dict[str, Any]:
         """Generate JSON report."""
-        duration = time.time() - self.start_time
+        duration = time.perf_counter() - self.start_time
 
         summary = {
             "total": len(self.test_results),
@@ -49,7 +49,7 @@ def test_enhanced_configuration():
     # Test configuration properties
     tracker.record_assertion(config.parallel_workers > 0, "Parallel workers configured")
     tracker.record_assertion(config.timeout_seconds > 0, "Timeout configured")
-    tracker.record_assertion(config.reports_dir.exists(), "Reports directory exists")
+    tracker.record_assertion(config.ensure_reports_dir().exists(), "Reports directory exists")
 
     # Test pytest args generation
     args = config.get_pytest_args()